@@ -6,16 +6,17 @@ import logging
 import math
 import os
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 
 from app.models.trade_contract import TradeContract
 from app.services.validation_events import emit_validation_event
-from app.utils.report_conformance import validate_report_file
+from app.utils.report_conformance import load_conforming_report, validate_report_file
 from app.utils.computed_metrics import apply_metrics_contract
 from app.utils.normalize import normalize_trade, strategy_label as _strategy_label, strip_legacy_fields
 from app.utils.trade_key import canonicalize_trade_key, canonicalize_strategy_id, trade_key
@@ -159,14 +160,42 @@ def _normalize_report_trades(rows: list[dict], expiration_hint: str | None = Non
     return out
 
 
-@router.get("/api/reports")
-async def list_reports(request: Request) -> list[str]:
-    results_dir: Path = request.app.state.results_dir
-    if not results_dir.exists():
+# results_dir -> (directory st_mtime_ns, report filenames newest-first).
+# Adding or deleting a report bumps the directory mtime, which forces a rescan;
+# paths that write or delete reports also invalidate explicitly, since a
+# coarse-timestamp filesystem can leave the mtime unchanged within one tick.
+_REPORT_LIST_CACHE: dict[Path, tuple[int, list[str]]] = {}
+
+
+def _invalidate_report_list(results_dir: Path) -> None:
+    _REPORT_LIST_CACHE.pop(results_dir, None)
+
+
+def _list_report_files(results_dir: Path, limit: int | None = None) -> list[str]:
+    try:
+        mtime_ns = results_dir.stat().st_mtime_ns
+    except FileNotFoundError:
+        _REPORT_LIST_CACHE.pop(results_dir, None)
         return []
-    files = [p.name for p in results_dir.glob("analysis_*.json")]
+
+    cached = _REPORT_LIST_CACHE.get(results_dir)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1][:limit]
+
+    with os.scandir(results_dir) as it:
+        files = [e.name for e in it if e.name.startswith("analysis_") and e.name.endswith(".json")]
     files.sort(reverse=True)
-    return files
+    _REPORT_LIST_CACHE[results_dir] = (mtime_ns, files)
+    return files[:limit]
+
+
+@router.get("/api/reports")
+async def list_reports(
+    request: Request,
+    limit: int | None = Query(default=None, ge=1, description="Return only the newest N reports"),
+) -> list[str]:
+    results_dir: Path = request.app.state.results_dir
+    return _list_report_files(results_dir, limit)
 
 
 def _strip_and_audit(trades: list[dict]) -> list[dict]:
@@ -179,18 +208,31 @@ def _strip_and_audit(trades: list[dict]) -> list[dict]:
     return out
 
 
+# Report files are written once; keying on st_mtime_ns retires an entry if a
+# file is ever rewritten.  Cached dicts are shared across requests, so the
+# normalization below must treat them as read-only.
+@lru_cache(maxsize=128)
+def _load_conforming_report_cached(path: Path, mtime_ns: int) -> dict[str, Any] | None:
+    return load_conforming_report(path)
+
+
 @router.get("/api/reports/{filename}")
 async def get_report(filename: str, request: Request):
     if not filename.startswith("analysis_") or not filename.endswith(".json"):
         raise HTTPException(status_code=400, detail="Invalid filename")
 
     file_path = request.app.state.results_dir / filename
-    if not file_path.exists():
+    try:
+        mtime_ns = file_path.stat().st_mtime_ns
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Report not found")
 
-    ve = getattr(request.app.state, "validation_events", None)
-    data = validate_report_file(file_path, validation_events=ve, auto_delete=True)
+    data = _load_conforming_report_cached(file_path, mtime_ns)
+    if data is None:
+        ve = getattr(request.app.state, "validation_events", None)
+        data = validate_report_file(file_path, validation_events=ve, auto_delete=True)
     if data is None:
+        _invalidate_report_list(request.app.state.results_dir)
         raise HTTPException(status_code=404, detail="Report removed: non-conforming")
 
     if isinstance(data, list):
@@ -236,6 +278,7 @@ async def generate_report_stream(request: Request):
                     "SPY",
                     progress_callback=progress_callback,
                 )
+                _invalidate_report_list(request.app.state.results_dir)
                 await queue.put(("done", {"filename": summary["filename"]}))
             except Exception as exc:
                 await queue.put(("error", {"message": str(exc)}))
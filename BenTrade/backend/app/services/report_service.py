@@ -571,7 +571,8 @@ class ReportService:
         validated: list[dict[str, Any]] = []
         for tr in unique:
             try:
-                cs = CreditSpread(
+                # Construction validates the spread.
+                CreditSpread(
                     spread_type=tr.get("spread_type"),
                     underlying_price=float(tr.get("underlying_price") or tr.get("price")),
                     short_strike=float(tr.get("short_strike")),
@@ -582,7 +583,6 @@ class ReportService:
                     implied_vol=tr.get("iv") or tr.get("implied_vol"),
                     realized_vol=tr.get("realized_vol"),
                 )
-                cs.validate()
                 validated.append(tr)
             except Exception:
                 continue
@@ -51,3 +51,9 @@ class InMemoryTradingRepository:
                 idempotency_key=idempotency_key,
                 response=response,
             )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tickets.clear()
+            self._orders.clear()
+            self._idempotency.clear()
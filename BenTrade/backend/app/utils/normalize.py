@@ -19,11 +19,12 @@ fields from trade dicts before returning to the frontend.
 from __future__ import annotations
 
 import logging
+import sys
 from typing import Any
 
-from app.utils.computed_metrics import apply_metrics_contract
+from app.utils.computed_metrics import apply_metrics_contract, is_credit_strategy, is_debit_strategy
 from app.utils.strategy_id_resolver import resolve_strategy_id_or_none
-from app.utils.trade_key import canonicalize_strategy_id, canonicalize_trade_key, trade_key
+from app.utils.trade_key import canonicalize_trade_key, trade_key
 
 _log = logging.getLogger("bentrade.normalize")
 
@@ -51,8 +52,12 @@ def _first_number(row: dict[str, Any], *keys: str) -> float | None:
 
 
 def _upsert_warning(row: dict[str, Any], code: str) -> None:
-    """Append *code* to ``validation_warnings`` if not already present."""
-    warnings = row.get("validation_warnings") if isinstance(row.get("validation_warnings"), list) else []
+    """Append *code* to ``validation_warnings`` if not already present.
+
+    Works on a copy so the caller's original list (e.g. a cached stored
+    report) is never modified.
+    """
+    warnings = list(row.get("validation_warnings")) if isinstance(row.get("validation_warnings"), list) else []
     if code not in warnings:
         warnings.append(code)
     row["validation_warnings"] = warnings
@@ -131,6 +136,11 @@ def strategy_label(strategy_id: str) -> str:
     return _STRATEGY_LABELS.get(key, key.replace("_", " ").title() or "Trade")
 
 
+def _format_dte(value: float) -> str:
+    """Render a DTE float as ``"30"`` when whole, else ``"30.5"``."""
+    return str(int(value)) if value.is_integer() else str(value)
+
+
 # ── composite-strike derivation ──────────────────────────────────────
 
 
@@ -185,8 +195,6 @@ def _compute_spread_pricing(
     Inputs: legs[].bid, legs[].ask, legs[].mid
     Outputs: spread_mid, spread_natural, spread_mark (avg of mid+natural)
     """
-    from app.utils.computed_metrics import is_credit_strategy, is_debit_strategy
-
     result: dict[str, float | None] = {
         "spread_mid": None,
         "spread_natural": None,
@@ -361,6 +369,17 @@ def _validate_legs_occ(normalized: dict[str, Any]) -> None:
         )
 
 
+# ── per-share → per-contract scaling table ──────────────────────────
+# (output key, per-contract source keys, per-share source key,
+#  fallback keys used when neither is present)
+
+_PER_SHARE_SCALING: tuple[tuple[str, tuple[str, ...], str, tuple[str, ...]], ...] = (
+    ("expected_value", ("ev_per_contract", "expected_value", "ev"), "ev_per_share", ()),
+    ("max_profit", ("max_profit_per_contract",), "max_profit_per_share", ("max_profit",)),
+    ("max_loss", ("max_loss_per_contract",), "max_loss_per_share", ("max_loss",)),
+)
+
+
 # ── main entry point ─────────────────────────────────────────────────
 
 
@@ -405,7 +424,6 @@ def normalize_trade(
     # GUARD: Never propagate the *wrong* cashflow field from an old
     # sub-dict.  E.g. a stored report with a corrupted computed_metrics
     # that has net_debit on a credit strategy must not seed root.net_debit.
-    from app.utils.computed_metrics import is_credit_strategy, is_debit_strategy
     _step0_strat = (
         str(normalized.get("spread_type")
             or normalized.get("strategy")
@@ -435,9 +453,7 @@ def normalize_trade(
         or ""
     ).upper()
     if symbol:
-        normalized["underlying"] = symbol
-        normalized["underlying_symbol"] = symbol
-        normalized["symbol"] = symbol
+        normalized["underlying"] = normalized["underlying_symbol"] = normalized["symbol"] = symbol
 
     # ── 2. Strategy canonicalization + triple-write ───────────────────
     raw_spread_type = (
@@ -447,13 +463,16 @@ def normalize_trade(
         or strategy_id
     )
     # Use the single resolver (emits STRATEGY_ALIAS_USED for aliases).
+    # The resolver is one dict probe against _STRATEGY_ALIASES, so no
+    # second canonicalization pass is needed here.
+    # Resolved IDs are the alias table's own (compile-time interned)
+    # literals; intern the unknown-strategy fallback too so the triple-
+    # write below and downstream dict lookups share one string object.
     spread_type = resolve_strategy_id_or_none(raw_spread_type)
-    # Keep old canonicalize call for alias_mapped metadata (cheap, no side-effects).
-    _, alias_mapped, provided_strategy = canonicalize_strategy_id(raw_spread_type)
-    spread_type = spread_type or str(strategy_id or raw_spread_type or "NA").strip().lower() or "NA"
-    normalized["spread_type"] = spread_type
-    normalized["strategy"] = spread_type
-    normalized["strategy_id"] = spread_type
+    spread_type = spread_type or sys.intern(
+        str(strategy_id or raw_spread_type or "NA").strip().lower() or "NA"
+    )
+    normalized["spread_type"] = normalized["strategy"] = normalized["strategy_id"] = spread_type
 
     if strategy_id is not None:
         normalized["strategyId"] = strategy_id
@@ -501,27 +520,19 @@ def normalize_trade(
     # ── 7. Per-share → per-contract scaling ──────────────────────────
     multiplier = _to_float(normalized.get("contractsMultiplier") or normalized.get("contracts_multiplier")) or 100.0
 
-    expected_value_contract = _first_number(normalized, "ev_per_contract", "expected_value", "ev")
-    if expected_value_contract is None:
-        ev_share = _first_number(normalized, "ev_per_share")
-        if ev_share is not None:
-            expected_value_contract = ev_share * multiplier
-
-    max_profit_contract = _first_number(normalized, "max_profit_per_contract")
-    if max_profit_contract is None:
-        mp_share = _first_number(normalized, "max_profit_per_share")
-        if mp_share is not None:
-            max_profit_contract = mp_share * multiplier
-        else:
-            max_profit_contract = _first_number(normalized, "max_profit")
-
-    max_loss_contract = _first_number(normalized, "max_loss_per_contract")
-    if max_loss_contract is None:
-        ml_share = _first_number(normalized, "max_loss_per_share")
-        if ml_share is not None:
-            max_loss_contract = ml_share * multiplier
-        else:
-            max_loss_contract = _first_number(normalized, "max_loss")
+    per_contract: dict[str, float | None] = {}
+    for dst, contract_keys, share_key, fallback_keys in _PER_SHARE_SCALING:
+        value = _first_number(normalized, *contract_keys)
+        if value is None:
+            share_value = _first_number(normalized, share_key)
+            if share_value is not None:
+                value = share_value * multiplier
+            else:
+                value = _first_number(normalized, *fallback_keys)
+        per_contract[dst] = value
+    expected_value_contract = per_contract["expected_value"]
+    max_profit_contract = per_contract["max_profit"]
+    max_loss_contract = per_contract["max_loss"]
 
     # ── 7b. Spread pricing context (mid + natural) ─────────────────
     # Derived from legs[].bid/ask/mid.  Upstream values preserved if present.
@@ -544,6 +555,15 @@ def normalize_trade(
     _validate_legs_occ(normalized)
 
     # ── 8. Build computed / details / pills ──────────────────────────
+    ev_to_risk = _first_number(normalized, "ev_to_risk")
+    if (
+        ev_to_risk is None
+        and expected_value_contract is not None
+        and max_loss_contract
+        and abs(max_loss_contract) > 0
+    ):
+        ev_to_risk = round(expected_value_contract / abs(max_loss_contract), 4)
+
     computed: dict[str, Any] = {
         "max_profit": max_profit_contract,
         "max_loss": max_loss_contract,
@@ -575,15 +595,7 @@ def normalize_trade(
         "rv_20d": _first_number(normalized, "realized_vol_20d", "rv_20d"),
         "open_interest": _first_number(normalized, "open_interest"),
         "volume": _first_number(normalized, "volume"),
-        "ev_to_risk": (
-            _first_number(normalized, "ev_to_risk")
-            if _first_number(normalized, "ev_to_risk") is not None
-            else (
-                round(expected_value_contract / abs(max_loss_contract), 4)
-                if expected_value_contract is not None and max_loss_contract and abs(max_loss_contract) > 0
-                else None
-            )
-        ),
+        "ev_to_risk": ev_to_risk,
     }
 
     details: dict[str, Any] = {
@@ -616,10 +628,7 @@ def normalize_trade(
     if dte_front is not None and dte_back is not None:
         pills["dte_front"] = dte_front
         pills["dte_back"] = dte_back
-        pills["dte_label"] = (
-            f"DTE {int(dte_front) if float(dte_front).is_integer() else dte_front}"
-            f"/{int(dte_back) if float(dte_back).is_integer() else dte_back}"
-        )
+        pills["dte_label"] = f"DTE {_format_dte(dte_front)}/{_format_dte(dte_back)}"
 
     normalized["computed"] = computed
     normalized["details"] = details
@@ -634,7 +643,6 @@ def normalize_trade(
     # Old stored reports may have swapped values — detect and FIX, not
     # just warn.  Correction: move the wrong-side value to the correct
     # side if the correct side is empty, then null the wrong side.
-    from app.utils.computed_metrics import is_credit_strategy, is_debit_strategy
     _cm = normalized.get("computed_metrics") or {}
     if is_credit_strategy(spread_type):
         if _cm.get("net_debit") is not None:
@@ -705,23 +713,33 @@ def normalize_trade(
     # never reach the frontend.
 
     # ── 11. Validation warnings ──────────────────────────────────────
-    if computed["pop"] is None:
-        _upsert_warning(normalized, "POP_NOT_IMPLEMENTED_FOR_STRATEGY")
-    if pills["regime_label"] is None:
-        _upsert_warning(normalized, "REGIME_UNAVAILABLE")
-    if computed["max_profit"] is None:
-        _upsert_warning(normalized, "MAX_PROFIT_UNAVAILABLE")
-    if computed["max_loss"] is None:
-        _upsert_warning(normalized, "MAX_LOSS_UNAVAILABLE")
-    if computed["expected_value"] is None:
-        _upsert_warning(normalized, "EXPECTED_VALUE_UNAVAILABLE")
-    if computed["return_on_risk"] is None:
-        _upsert_warning(normalized, "RETURN_ON_RISK_UNAVAILABLE")
-    if details["break_even"] is None:
-        _upsert_warning(normalized, "BREAKEVEN_UNAVAILABLE")
-    if normalized.get("pricing", {}).get("spread_mid") is None:
-        _upsert_warning(normalized, "SPREAD_MID_UNAVAILABLE")
-    if normalized.get("pricing", {}).get("spread_natural") is None:
-        _upsert_warning(normalized, "SPREAD_NATURAL_UNAVAILABLE")
+    # Collect every missing-metric code first, then merge them into
+    # validation_warnings in one pass with a set for O(1) dedup (re-
+    # normalizing a stored trade must not duplicate existing codes).
+    pricing_ctx = normalized.get("pricing", {})
+    missing_codes = [
+        code
+        for missing, code in (
+            (computed["pop"] is None, "POP_NOT_IMPLEMENTED_FOR_STRATEGY"),
+            (pills["regime_label"] is None, "REGIME_UNAVAILABLE"),
+            (computed["max_profit"] is None, "MAX_PROFIT_UNAVAILABLE"),
+            (computed["max_loss"] is None, "MAX_LOSS_UNAVAILABLE"),
+            (computed["expected_value"] is None, "EXPECTED_VALUE_UNAVAILABLE"),
+            (computed["return_on_risk"] is None, "RETURN_ON_RISK_UNAVAILABLE"),
+            (details["break_even"] is None, "BREAKEVEN_UNAVAILABLE"),
+            (pricing_ctx.get("spread_mid") is None, "SPREAD_MID_UNAVAILABLE"),
+            (pricing_ctx.get("spread_natural") is None, "SPREAD_NATURAL_UNAVAILABLE"),
+        )
+        if missing
+    ]
+    if missing_codes:
+        warnings = normalized.get("validation_warnings")
+        warnings = list(warnings) if isinstance(warnings, list) else []
+        seen = set(warnings)
+        for code in missing_codes:
+            if code not in seen:
+                seen.add(code)
+                warnings.append(code)
+        normalized["validation_warnings"] = warnings
 
     return normalized
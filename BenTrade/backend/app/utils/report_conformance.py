@@ -70,6 +70,32 @@ def _annotate_empty_report(data: dict[str, Any]) -> None:
         warnings.append(default_warning)
 
 
+def _parse_report(path: Path) -> Any:
+    """Return the parsed JSON in *path*, or ``None`` if it cannot be read."""
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return None
+
+
+def _as_conforming(data: Any) -> dict[str, Any] | None:
+    """Return *data* annotated if it is a fully conforming report, else ``None``."""
+    if not is_conforming_report(data):
+        return None
+    _annotate_empty_report(data)  # sets report_status="ok"
+    return data
+
+
+def load_conforming_report(path: Path) -> dict[str, Any] | None:
+    """Parse *path* and return it only if it is a fully conforming report.
+
+    Unlike :func:`validate_report_file` this never deletes files or emits
+    events, so the result is safe to cache.  ``None`` means the caller
+    should fall back to :func:`validate_report_file`.
+    """
+    return _as_conforming(_parse_report(path))
+
+
 def validate_report_file(
     path: Path,
     *,
@@ -102,15 +128,12 @@ def validate_report_file(
     if not path.exists():
         return None
 
-    try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except Exception:
-        data = None
+    data = _parse_report(path)
 
     # Fully conforming (non-empty trades with canonical fields) — fast path.
-    if is_conforming_report(data):
-        _annotate_empty_report(data)  # sets report_status="ok"
-        return data  # type: ignore[return-value]
+    conforming = _as_conforming(data)
+    if conforming is not None:
+        return conforming
 
     # Loadable but with zero trades — keep and annotate.
     if is_loadable_report(data):
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 from typing import Any
 
 
@@ -40,7 +41,7 @@ _SPREAD_TYPE_ALIASES: dict[str, str] = {
     "stock_volatility_expansion": "stock_volatility_expansion",
 }
 
-CANONICAL_STRATEGY_IDS: set[str] = {
+CANONICAL_STRATEGY_IDS: frozenset[str] = frozenset({
     "put_credit_spread",
     "call_credit_spread",
     "put_debit",
@@ -63,13 +64,18 @@ CANONICAL_STRATEGY_IDS: set[str] = {
     "stock_momentum_breakout",
     "stock_mean_reversion",
     "stock_volatility_expansion",
-}
+})
 
 
 def normalize_strike(x: Any) -> str:
     if x in (None, ""):
         return "NA"
 
+    # Composite segments such as "P540|C570" (iron condor) or "L95|U105"
+    # (butterfly) can never parse as Decimal; skip the exception path.
+    if isinstance(x, str) and "|" in x:
+        return x.strip()
+
     try:
         value = Decimal(str(x).strip())
     except (InvalidOperation, ValueError):
@@ -94,7 +100,13 @@ def canonicalize_strategy_id(value: Any) -> tuple[str | None, bool, str]:
     normalized = str(value or "").strip().lower()
     if not normalized:
         return None, False, ""
+    return _canonicalize_normalized_strategy(normalized)
+
 
+# Callers pass arbitrary (possibly unhashable) values, so memoize on the
+# normalized string rather than the public entry point.
+@lru_cache(maxsize=256)
+def _canonicalize_normalized_strategy(normalized: str) -> tuple[str | None, bool, str]:
     mapped = _SPREAD_TYPE_ALIASES.get(normalized, normalized)
     if mapped not in CANONICAL_STRATEGY_IDS:
         return None, False, normalized
@@ -143,6 +155,11 @@ def canonicalize_trade_key(value: Any) -> str:
     raw = str(value or "").strip()
     if not raw:
         return ""
+    return _canonicalize_raw_trade_key(raw)
+
+
+@lru_cache(maxsize=256)
+def _canonicalize_raw_trade_key(raw: str) -> str:
     parts = raw.split("|")
     if len(parts) != 6:
         return raw
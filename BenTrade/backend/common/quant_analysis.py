@@ -11,7 +11,7 @@ No external deps required (math + dataclasses only).
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from math import sqrt, log, exp, erf
 from typing import Literal, Optional, Dict, Any, List
 import json
@@ -27,9 +27,12 @@ SpreadType = Literal["put_credit", "call_credit"]
 # -----------------------------
 # Helpers
 # -----------------------------
+_SQRT2 = sqrt(2.0)
+
+
 def _norm_cdf(x: float) -> float:
     """Standard normal CDF (approx via erf)."""
-    return 0.5 * (1.0 + erf(x / sqrt(2.0)))
+    return 0.5 * (1.0 + erf(x / _SQRT2))
 
 
 def expected_move(price: float, iv: float, dte: int) -> float:
@@ -131,7 +134,48 @@ def history_matches_spot(prices: Optional[List[float]], spot: float, tol: float
 # -----------------------------
 # Trade model
 # -----------------------------
-@dataclass(frozen=True)
+# Shared by CreditSpread's public methods and summary(), which computes the
+# per-share values once and passes them in.
+def _expected_value(p_win: float, max_profit: float, max_loss: float) -> float:
+    p_loss = 1.0 - p_win
+    return (p_win * max_profit) - (p_loss * max_loss)
+
+
+def _kelly(p_win: float, max_profit: float, max_loss: float) -> float:
+    b = max_profit / max_loss
+    q = 1.0 - p_win
+    return (b * p_win - q) / b
+
+
+def _clamp_unit(x: float) -> float:
+    # Same result as max(0.0, min(1.0, x)), NaN -> 1.0 included, without the
+    # two builtin calls.
+    if 0.0 < x < 1.0:
+        return x
+    return 0.0 if x <= 0.0 else 1.0
+
+
+def _quality_score(
+    p_win: float,
+    ror: float,
+    iv_rank_value: Optional[float],
+    w_pop: float = 0.4,
+    w_ror: float = 0.3,
+    w_ivrank: float = 0.3,
+    ror_cap: float = 0.5,
+) -> float:
+    inv_cap = 1.0 / max(1e-9, ror_cap)
+    pop = _clamp_unit(p_win)
+    ror_norm = _clamp_unit(ror * inv_cap)
+
+    if iv_rank_value is None:
+        iv_rank_value = 0.5  # neutral default if you don't supply it
+    ivr = _clamp_unit(iv_rank_value)
+
+    return (w_pop * pop) + (w_ror * ror_norm) + (w_ivrank * ivr)
+
+
+@dataclass(frozen=True, slots=True)
 class CreditSpread:
     spread_type: SpreadType
     underlying_price: float          # current underlying price (S)
@@ -143,6 +187,11 @@ class CreditSpread:
     implied_vol: Optional[float] = None      # annualized IV, e.g., 0.18
     realized_vol: Optional[float] = None     # annualized RV, e.g., 0.14
 
+    def __post_init__(self) -> None:
+        # Frozen, so the invariants checked here hold for the instance's
+        # lifetime; the methods below rely on them instead of re-validating.
+        self.validate()
+
     def validate(self) -> None:
         if self.underlying_price <= 0:
             raise ValueError("underlying_price must be > 0")
@@ -237,8 +286,6 @@ class CreditSpread:
 
         If p_win not supplied, uses delta approximation if available.
         """
-        self.validate()
-
         if p_win is None:
             pop = self.pop_delta_approx()
             if pop is None:
@@ -248,10 +295,7 @@ class CreditSpread:
         p_win_n = normalize_prob(p_win)
         if p_win_n is None:
             raise ValueError("p_win must be numeric")
-        p_win = p_win_n
-
-        p_loss = 1.0 - p_win
-        return (p_win * self.max_profit_per_share) - (p_loss * self.max_loss_per_share)
+        return _expected_value(p_win_n, self.max_profit_per_share, self.max_loss_per_share)
 
     def ev_to_risk(self, p_win: Optional[float] = None) -> float:
         """Normalized EV per $ at risk (per share)."""
@@ -260,7 +304,6 @@ class CreditSpread:
 
     def annualized_ror(self) -> float | None:
         """Annualized return on risk (ROR) assuming max profit over dte (optimistic upper-bound)."""
-        self.validate()
         if self.dte < 10:
             return None
         return annualized_return(self.return_on_risk, self.dte)
@@ -275,7 +318,6 @@ class CreditSpread:
           p = p_win
           q = 1-p
         """
-        self.validate()
         if p_win is None:
             pop = self.pop_delta_approx()
             if pop is None:
@@ -285,12 +327,8 @@ class CreditSpread:
         p_win_n = normalize_prob(p_win)
         if p_win_n is None:
             raise ValueError("p_win must be numeric")
-        p_win = p_win_n
-
-        b = self.max_profit_per_share / self.max_loss_per_share
-        q = 1.0 - p_win
-        f = (b * p_win - q) / b
-        return f  # can be negative; you can clamp at 0 if you only take +EV trades
+        # can be negative; you can clamp at 0 if you only take +EV trades
+        return _kelly(p_win_n, self.max_profit_per_share, self.max_loss_per_share)
 
     # --- Simple composite score (tweakable) ---
     def trade_quality_score(
@@ -310,8 +348,6 @@ class CreditSpread:
 
         If p_win not provided, uses delta approximation if available.
         """
-        self.validate()
-
         if p_win is None:
             pop = self.pop_delta_approx()
             if pop is None:
@@ -321,34 +357,29 @@ class CreditSpread:
         p_win_n = normalize_prob(p_win)
         if p_win_n is None:
             raise ValueError("p_win must be numeric")
-        p_win = p_win_n
-
-        pop = max(0.0, min(1.0, p_win))
-        ror_norm = max(0.0, min(1.0, self.return_on_risk / max(1e-9, ror_cap)))
-
-        if iv_rank_value is None:
-            iv_rank_value = 0.5  # neutral default if you don't supply it
-        ivr = max(0.0, min(1.0, iv_rank_value))
-
-        return (w_pop * pop) + (w_ror * ror_norm) + (w_ivrank * ivr)
+        return _quality_score(p_win_n, self.return_on_risk, iv_rank_value, w_pop, w_ror, w_ivrank, ror_cap)
 
     # --- Output ---
     def summary(self, p_win: Optional[float] = None, iv_rank_value: Optional[float] = None) -> Dict[str, Any]:
         """Convenient dict output for UI / logging."""
-        self.validate()
+        # Derived values are computed once and reused rather than going back
+        # through the per-metric methods.
+        max_profit = self.net_credit
+        max_loss = self.width - max_profit
+        ror = max_profit / max_loss
 
         # pick p_win if we can
         pop = self.pop_delta_approx()
         use_p_win = p_win if p_win is not None else pop
 
         out: Dict[str, Any] = {
-            **asdict(self),
+            **{name: getattr(self, name) for name in _CREDIT_SPREAD_FIELDS},
             "width": self.width,
-            "max_profit_per_share": self.max_profit_per_share,
-            "max_loss_per_share": self.max_loss_per_share,
+            "max_profit_per_share": max_profit,
+            "max_loss_per_share": max_loss,
             "break_even": self.break_even,
-            "return_on_risk": self.return_on_risk,
-            "risk_reward": self.risk_reward,
+            "return_on_risk": ror,
+            "risk_reward": max_loss / max_profit,
             "pop_delta_approx": pop,
             "expected_move": self.expected_move(),
             "iv_rv_ratio": self.iv_rv_ratio(),
@@ -359,12 +390,13 @@ class CreditSpread:
             use_p_win_n = normalize_prob(use_p_win)
             out["p_win_used"] = use_p_win_n
             if use_p_win_n is not None:
-                out["ev_per_share"] = self.expected_value_per_share(p_win=use_p_win_n)
-                out["ev_to_risk"] = self.ev_to_risk(p_win=use_p_win_n)
-                out["kelly_fraction"] = self.kelly_fraction(p_win=use_p_win_n)
-                out["trade_quality_score"] = self.trade_quality_score(p_win=use_p_win_n, iv_rank_value=iv_rank_value)
+                ev = _expected_value(use_p_win_n, max_profit, max_loss)
+                out["ev_per_share"] = ev
+                out["ev_to_risk"] = ev / max_loss
+                out["kelly_fraction"] = _kelly(use_p_win_n, max_profit, max_loss)
+                out["trade_quality_score"] = _quality_score(use_p_win_n, ror, iv_rank_value)
 
-        annualized = self.annualized_ror()
+        annualized = annualized_return(ror, self.dte) if self.dte >= 10 else None
         out["annualized_ror_upper_bound"] = annualized
         if annualized is None and self.dte < 10:
             out["validation_warnings"] = ["ANNUALIZE_SHORT_DTE"]
@@ -383,6 +415,10 @@ class CreditSpread:
         return out
 
 
+# Fields are plain scalars, so a shallow read replaces asdict()'s deepcopy walk.
+_CREDIT_SPREAD_FIELDS = tuple(f.name for f in fields(CreditSpread))
+
+
 # (CLI/example runner removed — this module exposes `CreditSpread` for import.)
 
 
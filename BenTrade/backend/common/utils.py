@@ -41,6 +41,9 @@ _MODEL_EVAL_KEYS = frozenset({'recommendation', 'confidence', 'risk_level', 'key
 
 def _strip_code_fences(text: str) -> str:
     """Remove markdown code fences, returning the inner content."""
+    if '```' not in text:
+        # Common case: clean JSON with no fence — skip the regex scan.
+        return text.strip()
     m = _CODE_FENCE_RE.search(text)
     return m.group(1).strip() if m else text.strip()
 
@@ -89,12 +92,14 @@ def _coerce_model_evaluation(parsed, original_trade: dict | None = None) -> dict
 
     Returns ``None`` only if the parsed data truly contains nothing usable.
     """
-    if parsed is None:
+    # Fast reject: None, scalars, strings and empty containers can never
+    # carry an evaluation, so skip the shape probes below entirely.
+    if not parsed or not isinstance(parsed, (dict, list)):
         return None
 
     # --- Shape: list of trades (expected by the prompt) ---
     if isinstance(parsed, list):
-        if len(parsed) >= 1 and isinstance(parsed[0], dict):
+        if isinstance(parsed[0], dict):
             first = parsed[0]
             if 'model_evaluation' in first and isinstance(first['model_evaluation'], dict):
                 return _normalize_eval(first['model_evaluation'])
@@ -103,9 +108,6 @@ def _coerce_model_evaluation(parsed, original_trade: dict | None = None) -> dict
                 return _normalize_eval(first)
         return None
 
-    if not isinstance(parsed, dict):
-        return None
-
     # --- Shape: dict with 'trades' key ---
     trades_list = parsed.get('trades')
     if isinstance(trades_list, list) and trades_list:
@@ -133,7 +135,9 @@ def _coerce_model_evaluation(parsed, original_trade: dict | None = None) -> dict
 
 def _looks_like_eval(d: dict) -> bool:
     """Check whether *d* looks like a model_evaluation object."""
-    return bool(d and isinstance(d, dict) and d.keys() & _MODEL_EVAL_KEYS)
+    # isdisjoint short-circuits on the first shared key and never builds
+    # an intermediate set (unlike ``d.keys() & _MODEL_EVAL_KEYS``).
+    return isinstance(d, dict) and not _MODEL_EVAL_KEYS.isdisjoint(d)
 
 
 def _normalize_eval(raw: dict) -> dict:
@@ -167,7 +171,18 @@ def _normalize_eval(raw: dict) -> dict:
     kf = raw.get('key_factors')
     if not isinstance(kf, list):
         kf = [str(kf)] if kf else []
-    kf = [str(f) for f in kf if str(f or '').strip()][:6]
+    # Keep the first 6 non-blank factors; stop scanning once full instead
+    # of stringifying the whole list and slicing afterwards.
+    key_factors = []
+    for f in kf:
+        if not f:
+            continue
+        text = str(f)
+        if text.strip():
+            key_factors.append(text)
+            if len(key_factors) == 6:
+                break
+    kf = key_factors
 
     summary = str(raw.get('summary') or raw.get('thesis') or '').strip()
 
@@ -335,7 +350,7 @@ def _normalize_eval(raw: dict) -> dict:
             print(f'[MODEL_CONTENT_GUARD] WARNING: {w}', file=_sys.stderr)
 
     # Legacy key_factors: always strings for backward compat
-    _kf_legacy = kf[:]
+    _kf_legacy = kf  # kf is a fresh list built above; no defensive copy needed
     if not _kf_legacy and key_drivers:
         for d in key_drivers:
             if isinstance(d, dict):
@@ -712,8 +727,8 @@ def generate_mock_report() -> str:
         enriched = final
 
     file_path = RESULTS_DIR / filename
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(enriched, f, indent=2, default=str)
+    # Serialize once and write once rather than streaming json.dump's small chunks.
+    file_path.write_text(json.dumps(enriched, indent=2, default=str), encoding='utf-8')
 
     # After writing the base enriched report, optionally call the local LM Studio model
     # to append a `model_evaluation` object to each trade. By default this is disabled
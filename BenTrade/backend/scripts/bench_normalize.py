@@ -0,0 +1,115 @@
+"""
+Benchmark script – trade normalization hot paths
+=================================================
+
+Times the calls the normalize/strip test suites lean on most, so changes
+to ``normalize_trade`` and friends can be compared run-over-run:
+
+- ``normalize_trade`` on a raw credit-spread row
+- ``normalize_trade`` → ``strip_legacy_fields`` (the API-boundary pipeline)
+- ``StrategyService._normalize_trade`` (plugin-aware report normalization)
+
+Not a test suite — it only prints timings.  Uses stdlib ``timeit`` so it
+runs anywhere the backend does.
+
+Usage:
+    cd BenTrade/backend
+    python scripts/bench_normalize.py [--number N] [--repeat R] [--json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+# Ensure the backend package is importable
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.strategy_service import StrategyService
+from app.utils.normalize import normalize_trade, strip_legacy_fields
+
+
+_RAW_CREDIT_SPREAD = {
+    "underlying": "SPY",
+    "spread_type": "put_credit_spread",
+    "expiration": "2026-03-20",
+    "short_strike": 550,
+    "long_strike": 545,
+    "dte": 30,
+    "ev_per_share": 0.25,
+    "max_profit_per_share": 1.10,
+    "max_loss_per_share": 3.90,
+    "p_win_used": 0.72,
+    "bid_ask_spread_pct": 0.05,
+    "strike_distance_pct": 0.02,
+    "rsi14": 48.0,
+    "realized_vol_20d": 0.15,
+    "contractsMultiplier": 100,
+}
+
+
+class _BaseStub:
+    tradier_client = None
+
+    @staticmethod
+    def get_source_health_snapshot() -> dict:
+        return {}
+
+
+class _RiskStub:
+    @staticmethod
+    def get_policy() -> dict:
+        return {}
+
+
+def _cases(results_dir: Path) -> dict:
+    svc = StrategyService(
+        base_data_service=_BaseStub(),
+        results_dir=results_dir,
+        risk_policy_service=_RiskStub(),
+        signal_service=None,
+        regime_service=None,
+    )
+    return {
+        "normalize_trade": lambda: normalize_trade(_RAW_CREDIT_SPREAD),
+        "normalize_then_strip": lambda: strip_legacy_fields(normalize_trade(_RAW_CREDIT_SPREAD)),
+        "strategy_service._normalize_trade": lambda: svc._normalize_trade(
+            strategy_id="credit_spread",
+            expiration="2026-03-20",
+            trade=_RAW_CREDIT_SPREAD,
+        ),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=2000, help="calls per timing sample")
+    parser.add_argument("--repeat", type=int, default=5, help="timing samples per case")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, fn in _cases(Path(tmp)).items():
+            fn()  # warm caches / lazy imports
+            samples = timeit.repeat(fn, number=args.number, repeat=args.repeat)
+            results[name] = {
+                "best_us": min(samples) / args.number * 1e6,
+                "number": args.number,
+                "repeat": args.repeat,
+            }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'case':<36} {'best (us/call)':>14}")
+    for name, row in results.items():
+        print(f"{name:<36} {row['best_us']:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+from typing import TYPE_CHECKING
+
 import pytest
 
+if TYPE_CHECKING:
+    from app.services.strategy_service import StrategyService
+
+# The ``app`` / ``common`` packages are put on sys.path by the
+# ``pythonpath`` setting in the repo-root pyproject.toml, so neither this
+# file nor the individual test modules carry their own sys.path bootstrap.
+
 
 @pytest.fixture(autouse=True)
 def _reset_routing_rotation():
@@ -22,3 +32,47 @@ def _reset_routing_rotation():
     yield
     reset_rotation_counter()
     get_circuit_breaker().reset()
+
+
+@pytest.fixture(scope="session")
+def run_async():
+    """Run a coroutine to completion on one event loop shared by the session.
+
+    ``asyncio.run()`` builds and tears down a fresh loop (plus its default
+    executor) on every call.  Tests that only need to drive a coroutine
+    synchronously should take this fixture instead.
+    """
+    with asyncio.Runner() as runner:
+        yield runner.run
+
+
+class _StrategyBaseStub:
+    tradier_client = None
+
+    @staticmethod
+    def get_source_health_snapshot() -> dict:
+        return {}
+
+
+class _StrategyRiskStub:
+    @staticmethod
+    def get_policy() -> dict:
+        return {}
+
+
+@pytest.fixture(scope="module")
+def strategy_service(tmp_path_factory: pytest.TempPathFactory) -> StrategyService:
+    """A StrategyService with stubbed data/risk services, built once per module.
+
+    ``_normalize_trade`` keeps no per-trade state, so the normalize-trade
+    contract tests can share one instance and one results directory.
+    """
+    from app.services.strategy_service import StrategyService
+
+    return StrategyService(
+        base_data_service=_StrategyBaseStub(),
+        results_dir=tmp_path_factory.mktemp("strategy"),
+        risk_policy_service=_StrategyRiskStub(),
+        signal_service=None,
+        regime_service=None,
+    )
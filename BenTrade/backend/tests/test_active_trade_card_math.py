@@ -16,17 +16,10 @@ from __future__ import annotations
 
 import importlib
 import math
-import sys
-from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 
-# ── ensure importable ────────────────────────────────────────────────
-_backend = Path(__file__).resolve().parent.parent
-if str(_backend) not in sys.path:
-    sys.path.insert(0, str(_backend))
-
 from app.api.routes_active_trades import _normalize_positions
 
 
@@ -13,16 +13,9 @@ Validates:
 from __future__ import annotations
 
 import math
-import sys
-from pathlib import Path
 
 import pytest
 
-# ── ensure importable ───────────────────────────────────────────────
-_backend = Path(__file__).resolve().parent.parent
-if str(_backend) not in sys.path:
-    sys.path.insert(0, str(_backend))
-
 from app.services.active_trade_monitor_service import (
     SCORE_WEIGHTS,
     STATUS_THRESHOLDS,
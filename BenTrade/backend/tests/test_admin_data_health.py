@@ -1,16 +1,11 @@
 from __future__ import annotations
 
-import sys
 from pathlib import Path
 
 from fastapi.testclient import TestClient
 
-BACKEND_ROOT = Path(__file__).resolve().parents[1]
-if str(BACKEND_ROOT) not in sys.path:
-    sys.path.insert(0, str(BACKEND_ROOT))
-
-from app.main import create_app  # noqa: E402
-from app.services.validation_events import ValidationEventsService  # noqa: E402
+from app.main import create_app
+from app.services.validation_events import ValidationEventsService
 
 
 class _DummyBaseDataService:
@@ -10,17 +10,11 @@ Covers:
 from __future__ import annotations
 
 import math
-import sys
 import types
-from pathlib import Path
 from typing import Any
 
 import pytest
 
-BACKEND_ROOT = Path(__file__).resolve().parent.parent
-if str(BACKEND_ROOT) not in sys.path:
-    sys.path.insert(0, str(BACKEND_ROOT))
-
 from app.utils.candidate_sampler import (
     _safe_float,
     compute_pre_score,
@@ -1,6 +1,5 @@
 """Verify the new 4-tier metric resolution logic against real trade data."""
 import json
-import sys
 import os
 
 import pytest
@@ -8,7 +7,6 @@ import pytest
 _HERE = os.path.dirname(os.path.abspath(__file__))
 _BACKEND = os.path.dirname(_HERE)
 _RESULTS = os.path.join(_BACKEND, "results")
-sys.path.insert(0, _BACKEND)
 from app.utils.normalize import normalize_trade, strip_legacy_fields
 
 
@@ -5,16 +5,10 @@ POST /api/trading/close-submit
 """
 from __future__ import annotations
 
-import sys
-from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
-BACKEND_ROOT = Path(__file__).resolve().parents[1]
-if str(BACKEND_ROOT) not in sys.path:
-    sys.path.insert(0, str(BACKEND_ROOT))
-
 from app.api.routes_trading import _build_close_tradier_payload
 from app.trading.models import (
     CloseOrderLeg,
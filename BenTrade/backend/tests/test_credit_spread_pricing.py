@@ -52,29 +52,27 @@ class TestCreditSpreadModel:
         assert cs.break_even == pytest.approx(593.80)
 
     def test_net_credit_exceeds_width_raises(self) -> None:
-        cs = CreditSpread(
-            spread_type="put_credit",
-            underlying_price=600.0,
-            short_strike=595.0,
-            long_strike=593.0,
-            net_credit=2.50,
-            dte=30,
-        )
         with pytest.raises(ValueError, match="net_credit must be < spread width"):
-            cs.validate()
+            CreditSpread(
+                spread_type="put_credit",
+                underlying_price=600.0,
+                short_strike=595.0,
+                long_strike=593.0,
+                net_credit=2.50,
+                dte=30,
+            )
 
     def test_net_credit_within_epsilon_of_width_raises(self) -> None:
         """net_credit within 0.01 of width should still be rejected."""
-        cs = CreditSpread(
-            spread_type="put_credit",
-            underlying_price=600.0,
-            short_strike=595.0,
-            long_strike=593.0,
-            net_credit=1.995,   # width=2.0, 1.995 > 2.0 - 0.01
-            dte=30,
-        )
         with pytest.raises(ValueError, match="net_credit must be < spread width"):
-            cs.validate()
+            CreditSpread(
+                spread_type="put_credit",
+                underlying_price=600.0,
+                short_strike=595.0,
+                long_strike=593.0,
+                net_credit=1.995,   # width=2.0, 1.995 > 2.0 - 0.01
+                dte=30,
+            )
 
     def test_net_credit_safely_below_width_passes(self) -> None:
         cs = CreditSpread(
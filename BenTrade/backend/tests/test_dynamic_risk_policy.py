@@ -10,15 +10,10 @@ Verifies:
 """
 from __future__ import annotations
 
-import sys
 from pathlib import Path
 
 import pytest
 
-BACKEND_ROOT = Path(__file__).resolve().parents[1]
-if str(BACKEND_ROOT) not in sys.path:
-    sys.path.insert(0, str(BACKEND_ROOT))
-
 from app.services.risk_policy_service import (
     RiskPolicyService,
     build_dynamic_policy,
@@ -14,17 +14,11 @@ Covers:
 """
 from __future__ import annotations
 
-import sys
-from pathlib import Path
 from types import SimpleNamespace
 from typing import Any
 
 import pytest
 
-BACKEND_ROOT = Path(__file__).resolve().parent.parent
-if str(BACKEND_ROOT) not in sys.path:
-    sys.path.insert(0, str(BACKEND_ROOT))
-
 from app.services.strategies.butterflies import ButterfliesStrategyPlugin
 from app.services.strategies.calendars import CalendarsStrategyPlugin
 from app.utils.computed_metrics import (
@@ -12,12 +12,6 @@ These tests confirm:
 """
 
 import unittest
-import sys
-from pathlib import Path
-
-BACKEND_ROOT = Path(__file__).resolve().parents[1]
-if str(BACKEND_ROOT) not in sys.path:
-    sys.path.insert(0, str(BACKEND_ROOT))
 
 from app.services.recommendation_service import RecommendationService
 
@@ -13,13 +13,8 @@ Coverage:
 
 from __future__ import annotations
 
-import sys
-import os
 import pytest
 
-# ── Path setup ──────────────────────────────────────────────────────────
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-
 from app.services.model_analysis_contract import (
     ANALYSIS_METADATA,
     normalize_model_analysis_response,
@@ -17,17 +17,12 @@ Coverage:
 
 from __future__ import annotations
 
-import sys
-import os
 import json
 import time
 import pytest
 from unittest.mock import patch, MagicMock
 from datetime import datetime, timezone
 
-# ── Path setup ──────────────────────────────────────────────────────────
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-
 from app.services.model_analysis_contract import (
     ANALYSIS_METADATA,
     normalize_model_analysis_response,
@@ -9,6 +9,8 @@ Covers:
 """
 import json
 
+import pytest
+
 from common.utils import (
     _find_json_block,
     _coerce_model_evaluation,
@@ -160,63 +162,60 @@ class TestNormalizeEval:
 # _coerce_model_evaluation
 # ---------------------------------------------------------------------------
 
-class TestCoerceModelEvaluation:
-    """The critical function — extracts model_evaluation from many LLM output shapes."""
-
-    def test_bare_eval_object(self):
-        """Model returned just the evaluation dict (most common mismatch)."""
-        parsed = {"recommendation": "ACCEPT", "confidence": 0.8, "risk_level": "Low",
-                  "key_factors": ["positive EV"], "summary": "Good trade"}
-        result = _coerce_model_evaluation(parsed)
-        assert result is not None
-        assert result["recommendation"] == "ACCEPT"
-
-    def test_list_of_one_trade_with_model_evaluation(self):
-        """Old expected shape: array of 1 trade with model_evaluation key."""
-        trade = {"symbol": "SPY", "model_evaluation": {
-            "recommendation": "REJECT", "confidence": 0.9, "risk_level": "High",
-            "key_factors": ["neg EV"], "summary": "Bad"
-        }}
-        result = _coerce_model_evaluation([trade])
-        assert result is not None
-        assert result["recommendation"] == "REJECT"
+# Each row: (id, parsed LLM output, expected recommendation or None).
+_COERCE_SHAPES = (
+    # Model returned just the evaluation dict (most common mismatch).
+    ("bare_eval_object",
+     {"recommendation": "ACCEPT", "confidence": 0.8, "risk_level": "Low",
+      "key_factors": ["positive EV"], "summary": "Good trade"},
+     "ACCEPT"),
+    # Old expected shape: array of 1 trade with model_evaluation key.
+    ("list_of_one_trade_with_model_evaluation",
+     [{"symbol": "SPY", "model_evaluation": {
+         "recommendation": "REJECT", "confidence": 0.9, "risk_level": "High",
+         "key_factors": ["neg EV"], "summary": "Bad"
+     }}],
+     "REJECT"),
+    # Model wrapped response in {model_evaluation: {...}}.
+    ("dict_with_model_evaluation_key",
+     {"model_evaluation": {
+         "recommendation": "NEUTRAL", "confidence": 0.5, "risk_level": "Moderate",
+         "key_factors": [], "summary": "Unclear"
+     }},
+     "NEUTRAL"),
+    # Model returned {trades: [{...model_evaluation...}]}.
+    ("dict_with_trades_key",
+     {"trades": [{"symbol": "SPY", "model_evaluation": {
+         "recommendation": "ACCEPT", "confidence": 0.7, "risk_level": "Low",
+         "key_factors": [], "summary": "OK"
+     }}]},
+     "ACCEPT"),
+    # Model returned [evaluation_obj] (bare eval in a list).
+    ("list_with_bare_eval_as_element",
+     [{"recommendation": "ACCEPT", "confidence": 0.75, "risk_level": "Low",
+       "key_factors": ["ok"], "summary": "Fine"}],
+     "ACCEPT"),
+    ("none_input", None, None),
+    ("unrecognized_shape", 42, None),
+    ("empty_dict", {}, None),
+)
 
-    def test_dict_with_model_evaluation_key(self):
-        """Model wrapped response in {model_evaluation: {...}}."""
-        parsed = {"model_evaluation": {
-            "recommendation": "NEUTRAL", "confidence": 0.5, "risk_level": "Moderate",
-            "key_factors": [], "summary": "Unclear"
-        }}
-        result = _coerce_model_evaluation(parsed)
-        assert result is not None
-        assert result["recommendation"] == "NEUTRAL"
 
-    def test_dict_with_trades_key(self):
-        """Model returned {trades: [{...model_evaluation...}]}."""
-        parsed = {"trades": [{"symbol": "SPY", "model_evaluation": {
-            "recommendation": "ACCEPT", "confidence": 0.7, "risk_level": "Low",
-            "key_factors": [], "summary": "OK"
-        }}]}
-        result = _coerce_model_evaluation(parsed)
-        assert result is not None
-        assert result["recommendation"] == "ACCEPT"
+class TestCoerceModelEvaluation:
+    """The critical function — extracts model_evaluation from many LLM output shapes."""
 
-    def test_list_with_bare_eval_as_element(self):
-        """Model returned [evaluation_obj] (bare eval in a list)."""
-        parsed = [{"recommendation": "ACCEPT", "confidence": 0.75, "risk_level": "Low",
-                   "key_factors": ["ok"], "summary": "Fine"}]
+    @pytest.mark.parametrize(
+        "parsed, expected",
+        [row[1:] for row in _COERCE_SHAPES],
+        ids=[row[0] for row in _COERCE_SHAPES],
+    )
+    def test_shape(self, parsed, expected):
         result = _coerce_model_evaluation(parsed)
-        assert result is not None
-        assert result["recommendation"] == "ACCEPT"
-
-    def test_none_input(self):
-        assert _coerce_model_evaluation(None) is None
-
-    def test_unrecognized_shape(self):
-        assert _coerce_model_evaluation(42) is None
-
-    def test_empty_dict(self):
-        assert _coerce_model_evaluation({}) is None
+        if expected is None:
+            assert result is None
+        else:
+            assert result is not None
+            assert result["recommendation"] == expected
 
 
 # ---------------------------------------------------------------------------
@@ -15,15 +15,8 @@ Coverage targets:
 
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-
 import pytest
 
-BACKEND_ROOT = Path(__file__).resolve().parents[1]
-if str(BACKEND_ROOT) not in sys.path:
-    sys.path.insert(0, str(BACKEND_ROOT))
-
 from app.utils.normalize import normalize_trade, strategy_label
 
 
@@ -100,6 +93,23 @@ def test_null_fields_stay_null():
     assert cm["pop"] is None
 
 
+def test_nan_max_loss_leaves_ev_to_risk_null():
+    """A NaN max_loss must not yield a NaN ev_to_risk."""
+    trade = {
+        "underlying": "SPY",
+        "spread_type": "put_credit_spread",
+        "expiration": "2026-03-20",
+        "short_strike": 550,
+        "long_strike": 545,
+        "dte": 30,
+        "ev_per_contract": 25.0,
+        "max_loss_per_contract": float("nan"),
+    }
+    result = normalize_trade(trade)
+
+    assert result["computed"]["ev_to_risk"] is None
+
+
 # ── 3. Composite-strike keys — iron condor ───────────────────────────
 
 
@@ -248,6 +258,27 @@ def test_no_duplicate_warnings():
         assert warnings.count(code) == 1
 
 
+def test_input_warnings_list_not_mutated():
+    """Stored reports are cached and shared, so normalizing must not write into them."""
+    stored_warnings = ["STALE_QUOTE"]
+    trade = {
+        "underlying": "MSFT",
+        "spread_type": "put_credit_spread",
+        "expiration": "2026-03-20",
+        "short_strike": 400,
+        "long_strike": 395,
+        "dte": 30,
+        "net_debit": 1.0,
+        "legs": [{"strike": 400, "side": "sell"}],
+        "validation_warnings": stored_warnings,
+    }
+    result = normalize_trade(trade)
+
+    assert stored_warnings == ["STALE_QUOTE"]
+    assert "MISSING_OCC_SYMBOL" in result["validation_warnings"]
+    assert "REGIME_UNAVAILABLE" in result["validation_warnings"]
+
+
 # ── 8. Pills sub-dict shape ─────────────────────────────────────────
 
 
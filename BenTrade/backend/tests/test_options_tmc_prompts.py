@@ -3,15 +3,9 @@
 from __future__ import annotations
 
 import json
-import sys
-from pathlib import Path
 
 import pytest
 
-BACKEND_ROOT = Path(__file__).resolve().parents[1]
-if str(BACKEND_ROOT) not in sys.path:
-    sys.path.insert(0, str(BACKEND_ROOT))
-
 from common.options_tmc_prompts import (
     OPTIONS_TMC_FINAL_DECISION_SYSTEM_PROMPT,
     OPTIONS_TMC_TEMPERATURE,
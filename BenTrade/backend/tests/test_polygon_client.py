@@ -2,27 +2,17 @@
 
 from __future__ import annotations
 
-import asyncio
-import sys
-from pathlib import Path
-from typing import Any
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Mapping
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-BACKEND_ROOT = Path(__file__).resolve().parents[1]
-if str(BACKEND_ROOT) not in sys.path:
-    sys.path.insert(0, str(BACKEND_ROOT))
-
 from app.clients.polygon_client import PolygonClient
 from app.services.base_data_service import BaseDataService
 
 
-def _run(coro):
-    """Python 3.14-safe helper to run a coroutine synchronously."""
-    return asyncio.run(coro)
-
-
 # ---------------------------------------------------------------------------
 # Fixtures / helpers
 # ---------------------------------------------------------------------------
@@ -49,67 +39,80 @@ class _NullCache:
 
 class _DummyClient:
     """Generic duck-typed client for slots the test doesn't exercise."""
+    __slots__ = ("settings",)
+
     def __init__(self):
         self.settings = _DummySettings()
 
 
-SAMPLE_POLYGON_RESPONSE: dict[str, Any] = {
+@dataclass(slots=True)
+class _PolygonStub:
+    """Minimal stand-in for the PolygonClient surface BaseDataService uses."""
+    settings: Any
+    closes: list[float] | None = None
+    exc: Exception | None = None
+
+    async def get_daily_closes(self, _ticker: str, lookback_days: int = 365) -> list[float]:
+        if self.exc is not None:
+            raise self.exc
+        return self.closes or []
+
+
+# Shared read-only payloads.  _parse_aggs only reads its input, so the
+# samples are frozen (MappingProxyType / tuples) and reused by every test
+# without copying; any accidental mutation raises instead of leaking
+# state between tests.
+SAMPLE_POLYGON_RESPONSE: Mapping[str, Any] = MappingProxyType({
     "ticker": "SPY",
     "queryCount": 5,
     "resultsCount": 5,
     "adjusted": True,
     "status": "OK",
-    "results": [
+    "results": tuple(MappingProxyType(bar) for bar in (
         {"v": 100000, "vw": 510.5, "o": 509.0, "c": 511.2, "h": 512.0, "l": 508.5, "t": 1770681600000, "n": 500},
         {"v": 110000, "vw": 512.0, "o": 511.0, "c": 513.4, "h": 514.0, "l": 510.0, "t": 1770768000000, "n": 600},
         {"v": 90000, "vw": 513.0, "o": 513.0, "c": 512.1, "h": 515.0, "l": 511.5, "t": 1770854400000, "n": 550},
         {"v": 105000, "vw": 511.5, "o": 512.0, "c": 510.8, "h": 513.0, "l": 509.0, "t": 1770940800000, "n": 520},
         {"v": 95000, "vw": 510.0, "o": 510.5, "c": 511.0, "h": 512.5, "l": 509.5, "t": 1771027200000, "n": 480},
-    ],
-}
+    )),
+})
 
-EMPTY_POLYGON_RESPONSE: dict[str, Any] = {
+EMPTY_POLYGON_RESPONSE: Mapping[str, Any] = MappingProxyType({
     "ticker": "ZZZZZ",
     "queryCount": 0,
     "resultsCount": 0,
     "adjusted": True,
     "status": "OK",
-    "results": [],
-}
+    "results": (),
+})
 
 
 # ---------------------------------------------------------------------------
 # Unit tests â€“ PolygonClient._parse_aggs
 # ---------------------------------------------------------------------------
 
-class TestParseAggs:
-    def test_normal_bars(self) -> None:
-        bars = PolygonClient._parse_aggs(SAMPLE_POLYGON_RESPONSE)
-        assert len(bars) == 5
-        assert bars[0]["date"] == "2026-02-10"
-        assert bars[0]["close"] == 511.2
-        assert bars[0]["open"] == 509.0
-        assert bars[0]["high"] == 512.0
-        assert bars[0]["low"] == 508.5
-        assert bars[0]["volume"] == 100000
-
-    def test_empty_results(self) -> None:
-        bars = PolygonClient._parse_aggs(EMPTY_POLYGON_RESPONSE)
-        assert bars == []
-
-    def test_missing_timestamp_skipped(self) -> None:
-        payload = {"results": [{"o": 1, "h": 2, "l": 0.5, "c": 1.5}]}
-        bars = PolygonClient._parse_aggs(payload)
-        assert bars == []
+# (id, payload, expected bar count, expected first bar subset or None)
+_PARSE_AGGS_CASES = (
+    ("normal_bars", SAMPLE_POLYGON_RESPONSE, 5,
+     {"date": "2026-02-10", "close": 511.2, "open": 509.0, "high": 512.0, "low": 508.5, "volume": 100000}),
+    ("empty_results", EMPTY_POLYGON_RESPONSE, 0, None),
+    ("missing_timestamp_skipped", {"results": [{"o": 1, "h": 2, "l": 0.5, "c": 1.5}]}, 0, None),
+    ("missing_ohlc_skipped", {"results": [{"t": 1739145600000}]}, 0, None),
+    ("no_results_key", {"status": "OK"}, 0, None),
+)
 
-    def test_missing_ohlc_skipped(self) -> None:
-        payload = {"results": [{"t": 1739145600000}]}
-        bars = PolygonClient._parse_aggs(payload)
-        assert bars == []
 
-    def test_no_results_key(self) -> None:
-        bars = PolygonClient._parse_aggs({"status": "OK"})
-        assert bars == []
+class TestParseAggs:
+    @pytest.mark.parametrize(
+        "payload, expected_len, first_bar",
+        [case[1:] for case in _PARSE_AGGS_CASES],
+        ids=[case[0] for case in _PARSE_AGGS_CASES],
+    )
+    def test_parse_aggs(self, payload, expected_len, first_bar) -> None:
+        bars = PolygonClient._parse_aggs(payload)
+        assert len(bars) == expected_len
+        if first_bar is not None:
+            assert {k: bars[0][k] for k in first_bar} == first_bar
 
 
 # ---------------------------------------------------------------------------
@@ -117,20 +120,20 @@ class TestParseAggs:
 # ---------------------------------------------------------------------------
 
 class TestGetDailyCloses:
-    def test_returns_flat_close_list(self) -> None:
+    def test_returns_flat_close_list(self, run_async) -> None:
         http = MagicMock()
         client = PolygonClient(settings=_DummySettings(), http_client=http, cache=_NullCache())
 
         with patch.object(client, "_request_with_retry", new_callable=AsyncMock) as mock_req:
             mock_req.return_value = SAMPLE_POLYGON_RESPONSE
-            closes = _run(client.get_daily_closes("SPY"))
+            closes = run_async(client.get_daily_closes("SPY"))
 
         assert closes == [511.2, 513.4, 512.1, 510.8, 511.0]
 
-    def test_empty_ticker_returns_empty(self) -> None:
+    def test_empty_ticker_returns_empty(self, run_async) -> None:
         http = MagicMock()
         client = PolygonClient(settings=_DummySettings(), http_client=http, cache=_NullCache())
-        closes = _run(client.get_daily_closes(""))
+        closes = run_async(client.get_daily_closes(""))
         assert closes == []
 
 
@@ -139,10 +142,10 @@ class TestGetDailyCloses:
 # ---------------------------------------------------------------------------
 
 class TestPolygonHealth:
-    def test_health_returns_false_when_no_api_key(self) -> None:
+    def test_health_returns_false_when_no_api_key(self, run_async) -> None:
         http = MagicMock()
         client = PolygonClient(settings=_NoKeySettings(), http_client=http, cache=_NullCache())
-        result = _run(client.health())
+        result = run_async(client.health())
         assert result is False
 
 
@@ -152,12 +155,8 @@ class TestPolygonHealth:
 
 class TestBaseDataServicePolygonIntegration:
     def _make_service(self, polygon_closes: list[float] | None = None) -> BaseDataService:
-        """Build a BaseDataService with a mocked polygon_client."""
-        polygon = MagicMock()
-        polygon.settings = _DummySettings()
-        polygon.get_daily_closes = AsyncMock(
-            return_value=polygon_closes if polygon_closes is not None else []
-        )
+        """Build a BaseDataService with a stubbed polygon_client."""
+        polygon = _PolygonStub(settings=_DummySettings(), closes=polygon_closes)
 
         svc = BaseDataService(
             tradier_client=_DummyClient(),
@@ -167,21 +166,19 @@ class TestBaseDataServicePolygonIntegration:
         )
         return svc
 
-    def test_polygon_returns_closes(self) -> None:
+    def test_polygon_returns_closes(self, run_async) -> None:
         svc = self._make_service(polygon_closes=[500.0, 501.0, 502.0])
-        closes = _run(svc.get_prices_history("SPY"))
+        closes = run_async(svc.get_prices_history("SPY"))
         assert closes == [500.0, 501.0, 502.0]
 
-    def test_polygon_empty_falls_back_to_tradier(self) -> None:
+    def test_polygon_empty_falls_back_to_tradier(self, run_async) -> None:
         svc = self._make_service(polygon_closes=[])
         # Tradier fallback will also fail (duck-typed dummy), so we get []
-        closes = _run(svc.get_prices_history("SPY"))
+        closes = run_async(svc.get_prices_history("SPY"))
         assert closes == []
 
-    def test_polygon_exception_falls_back(self) -> None:
-        polygon = MagicMock()
-        polygon.settings = _DummySettings()
-        polygon.get_daily_closes = AsyncMock(side_effect=Exception("Polygon down"))
+    def test_polygon_exception_falls_back(self, run_async) -> None:
+        polygon = _PolygonStub(settings=_DummySettings(), exc=Exception("Polygon down"))
 
         svc = BaseDataService(
             tradier_client=_DummyClient(),
@@ -190,17 +187,17 @@ class TestBaseDataServicePolygonIntegration:
             polygon_client=polygon,
         )
         # Both Polygon and Tradier fail â†’ []
-        closes = _run(svc.get_prices_history("SPY"))
+        closes = run_async(svc.get_prices_history("SPY"))
         assert closes == []
 
-    def test_no_polygon_client_falls_back(self) -> None:
+    def test_no_polygon_client_falls_back(self, run_async) -> None:
         svc = BaseDataService(
             tradier_client=_DummyClient(),
             finnhub_client=_DummyClient(),
             fred_client=_DummyClient(),
             polygon_client=None,
         )
-        closes = _run(svc.get_prices_history("SPY"))
+        closes = run_async(svc.get_prices_history("SPY"))
         assert closes == []
 
     def test_source_health_shows_polygon_configured(self) -> None:
@@ -208,8 +205,7 @@ class TestBaseDataServicePolygonIntegration:
         assert svc._source_configured("polygon") is True
 
     def test_source_health_shows_polygon_misconfigured(self) -> None:
-        polygon = MagicMock()
-        polygon.settings = _NoKeySettings()
+        polygon = _PolygonStub(settings=_NoKeySettings())
         svc = BaseDataService(
             tradier_client=_DummyClient(),
             finnhub_client=_DummyClient(),
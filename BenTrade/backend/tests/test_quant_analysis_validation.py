@@ -1,3 +1,5 @@
+import pytest
+
 from common.quant_analysis import CreditSpread, annualized_return
 
 
@@ -34,3 +36,25 @@ def test_annualized_ror_present_for_longer_dte() -> None:
     expected = annualized_return(spread.return_on_risk, spread.dte)
     assert summary["annualized_ror_upper_bound"] == expected
     assert "validation_warnings" not in summary
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        pytest.param({"net_credit": 6.0}, "spread width", id="credit_exceeds_width"),
+        pytest.param({"long_strike": 585.0}, "long_strike must be < short_strike", id="strike_order"),
+        pytest.param({"dte": 0}, "dte must be > 0", id="expired"),
+    ],
+)
+def test_invalid_spread_rejected_at_construction(kwargs, message) -> None:
+    fields = dict(spread_type="put_credit", underlying_price=600.0, short_strike=580.0,
+                  long_strike=575.0, net_credit=1.2, dte=21)
+    with pytest.raises(ValueError, match=message):
+        CreditSpread(**{**fields, **kwargs})
+
+
+def test_trade_quality_score_clamps_each_term() -> None:
+    # net_credit 4.0 on a 5-wide spread -> ROR 4.0, far past the 0.5 cap.
+    spread = CreditSpread("put_credit", 600.0, 580.0, 575.0, 4.0, 21)
+    assert spread.trade_quality_score(p_win=0.8, iv_rank_value=-0.3) == pytest.approx(0.4 * 0.8 + 0.3)
+    assert spread.trade_quality_score(p_win=0.8, iv_rank_value=float("nan")) == pytest.approx(0.4 * 0.8 + 0.3 + 0.3)
@@ -1,19 +1,8 @@
-import unittest
-import sys
-from pathlib import Path
-
-from fastapi.testclient import TestClient
+import pytest
 
 from app.services.recommendation_service import RecommendationService
 
 
-BACKEND_ROOT = Path(__file__).resolve().parents[1]
-if str(BACKEND_ROOT) not in sys.path:
-    sys.path.insert(0, str(BACKEND_ROOT))
-
-from app.main import create_app  # noqa: E402
-
-
 class _StubStrategyService:
     def __init__(self, *, reports_by_strategy=None, report_payloads=None, report_errors=None):
         self._reports_by_strategy = reports_by_strategy or {}
@@ -55,120 +44,110 @@ class _StubRegimeService:
         return self._payload or {"regime_label": "NEUTRAL", "regime_score": 50.0, "suggested_playbook": {}}
 
 
-def _build_client(*, strategy_service, scanner_service, regime_service) -> TestClient:
-    app = create_app()
+# The app and its TestClient are imported inside the fixtures so that
+# collection (``--collect-only`` / ``-k`` runs) does not load the full
+# app.main import graph.
+@pytest.fixture(scope="module")
+def app():
+    """Build the FastAPI app once; scenarios only swap the recommendation service."""
+    from app.main import create_app
+
+    return create_app()
+
+
+@pytest.fixture(scope="module")
+def client(app):
+    from fastapi.testclient import TestClient
+
+    return TestClient(app)
+
+
+def _install_recommendation_service(app, *, strategy_service, scanner_service, regime_service) -> None:
     app.state.recommendation_service = RecommendationService(
         strategy_service=strategy_service,
         stock_analysis_service=scanner_service,
         regime_service=regime_service,
     )
-    return TestClient(app)
 
 
-class RecommendationSmokeTests(unittest.IsolatedAsyncioTestCase):
-    async def test_recommendations_selector_handles_no_files_malformed_and_scanner(self):
-        scenarios = [
-            {
-                "name": "no_files",
-                "strategy": _StubStrategyService(reports_by_strategy={"credit_spread": []}),
-                "scanner": _StubStockAnalysisService(scanner_payload={"candidates": []}),
-                "expect_non_empty": False,
-            },
-            {
-                "name": "malformed_analysis",
-                "strategy": _StubStrategyService(
-                    reports_by_strategy={"credit_spread": ["analysis_bad.json"]},
-                    report_errors={("credit_spread", "analysis_bad.json"): ValueError("invalid json")},
-                ),
-                "scanner": _StubStockAnalysisService(scanner_payload={"candidates": []}),
-                "expect_non_empty": False,
-            },
-            {
-                "name": "scanner_fallback",
-                "strategy": _StubStrategyService(reports_by_strategy={"credit_spread": []}),
-                "scanner": _StubStockAnalysisService(
-                    scanner_payload={
-                        "candidates": [
-                            {
-                                "symbol": "SPY",
-                                "composite_score": 0.86,
-                                "price": 600.12,
-                                "signals": {"rsi_14": 55.0, "iv_rv_ratio": 1.12},
-                            }
-                        ]
-                    }
-                ),
-                "expect_non_empty": True,
-            },
-        ]
-
-        for scenario in scenarios:
-            service = RecommendationService(
-                strategy_service=scenario["strategy"],
-                stock_analysis_service=scenario["scanner"],
-                regime_service=_StubRegimeService(),
-            )
-
-            payload = await service.get_top_recommendations(limit=3)
-
-            self.assertIsInstance(payload, dict, msg=scenario["name"])
-            self.assertIn("picks", payload, msg=scenario["name"])
-            self.assertIn("notes", payload, msg=scenario["name"])
-            self.assertIsInstance(payload["picks"], list, msg=scenario["name"])
-            self.assertIsInstance(payload["notes"], list, msg=scenario["name"])
-
-            if scenario["expect_non_empty"]:
-                self.assertGreater(len(payload["picks"]), 0, msg=scenario["name"])
-
-
-class RecommendationEndpointSmokeTests(unittest.TestCase):
-    def test_recommendations_endpoint_returns_200_for_smoke_scenarios(self):
-        scenarios = [
-            {
-                "name": "no_files",
-                "strategy": _StubStrategyService(reports_by_strategy={"credit_spread": []}),
-                "scanner": _StubStockAnalysisService(scanner_payload={"candidates": []}),
-            },
-            {
-                "name": "malformed_analysis",
-                "strategy": _StubStrategyService(
-                    reports_by_strategy={"credit_spread": ["analysis_bad.json"]},
-                    report_errors={("credit_spread", "analysis_bad.json"): ValueError("invalid json")},
-                ),
-                "scanner": _StubStockAnalysisService(scanner_payload={"candidates": []}),
-            },
-            {
-                "name": "scanner_fallback",
-                "strategy": _StubStrategyService(reports_by_strategy={"credit_spread": []}),
-                "scanner": _StubStockAnalysisService(
-                    scanner_payload={
-                        "candidates": [
-                            {
-                                "symbol": "SPY",
-                                "composite_score": 0.86,
-                                "price": 600.12,
-                                "signals": {"rsi_14": 55.0, "iv_rv_ratio": 1.12},
-                            }
-                        ]
+# Each scenario: (strategy service, scanner service, expect non-empty picks).
+# The stubs are read-only, so one instance per scenario is shared by the
+# service-level and endpoint-level tests.
+_SCENARIOS = [
+    pytest.param(
+        _StubStrategyService(reports_by_strategy={"credit_spread": []}),
+        _StubStockAnalysisService(scanner_payload={"candidates": []}),
+        False,
+        id="no_files",
+    ),
+    pytest.param(
+        _StubStrategyService(
+            reports_by_strategy={"credit_spread": ["analysis_bad.json"]},
+            report_errors={("credit_spread", "analysis_bad.json"): ValueError("invalid json")},
+        ),
+        _StubStockAnalysisService(scanner_payload={"candidates": []}),
+        False,
+        id="malformed_analysis",
+    ),
+    pytest.param(
+        _StubStrategyService(reports_by_strategy={"credit_spread": []}),
+        _StubStockAnalysisService(
+            scanner_payload={
+                "candidates": [
+                    {
+                        "symbol": "SPY",
+                        "composite_score": 0.86,
+                        "price": 600.12,
+                        "signals": {"rsi_14": 55.0, "iv_rv_ratio": 1.12},
                     }
-                ),
-            },
-        ]
-
-        for scenario in scenarios:
-            client = _build_client(
-                strategy_service=scenario["strategy"],
-                scanner_service=scenario["scanner"],
-                regime_service=_StubRegimeService(),
-            )
-            response = client.get("/api/recommendations/top")
-            self.assertEqual(response.status_code, 200, msg=scenario["name"])
-            payload = response.json()
-            self.assertIn("picks", payload, msg=scenario["name"])
-            self.assertIn("notes", payload, msg=scenario["name"])
-            self.assertIsInstance(payload.get("picks"), list, msg=scenario["name"])
-            self.assertIsInstance(payload.get("notes"), list, msg=scenario["name"])
-
-
-if __name__ == "__main__":
-    unittest.main()
+                ]
+            }
+        ),
+        True,
+        id="scanner_fallback",
+    ),
+]
+
+
+@pytest.mark.parametrize("strategy, scanner, expect_non_empty", _SCENARIOS)
+def test_recommendations_selector_handles_no_files_malformed_and_scanner(
+    strategy, scanner, expect_non_empty, run_async,
+):
+    service = RecommendationService(
+        strategy_service=strategy,
+        stock_analysis_service=scanner,
+        regime_service=_StubRegimeService(),
+    )
+
+    payload = run_async(service.get_top_recommendations(limit=3))
+
+    assert isinstance(payload, dict)
+    assert "picks" in payload
+    assert "notes" in payload
+    assert isinstance(payload["picks"], list)
+    assert isinstance(payload["notes"], list)
+
+    if expect_non_empty:
+        assert len(payload["picks"]) > 0
+
+
+@pytest.mark.parametrize("strategy, scanner, expect_non_empty", _SCENARIOS)
+def test_recommendations_endpoint_returns_200_for_smoke_scenarios(
+    strategy, scanner, expect_non_empty, app, client,
+):
+    _install_recommendation_service(
+        app,
+        strategy_service=strategy,
+        scanner_service=scanner,
+        regime_service=_StubRegimeService(),
+    )
+    response = client.get("/api/recommendations/top")
+    assert response.status_code == 200
+    payload = response.json()
+    assert "picks" in payload
+    assert "notes" in payload
+    assert isinstance(payload.get("picks"), list)
+    assert isinstance(payload.get("notes"), list)
+
+    if expect_non_empty:
+        assert len(payload["picks"]) > 0
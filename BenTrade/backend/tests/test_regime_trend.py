@@ -1,5 +1,3 @@
-import unittest
-
 from app.services.regime_service import RegimeService
 
 
@@ -17,9 +15,18 @@ class _DummyFredClient:
     http_client = None
 
 
+# Synthetic SPY closes, built once at import.  Tuples keep them immutable
+# so the dummy service can hand them out without defensive copies.
+_SPY_RISING_260 = tuple(400.0 + i for i in range(260))
+_SPY_RISING_80 = tuple(500.0 + i for i in range(80))
+
+
 class _DummyBaseDataService:
     def __init__(self, spy_history):
-        self._spy_history = list(spy_history)
+        self._spy_history = tuple(spy_history)
+        # Other trend indexes get synthetic rising prices of the same length,
+        # built once here instead of on every snapshot/history call.
+        self._index_history = tuple(100.0 + (i * 0.5) for i in range(len(self._spy_history)))
         self.fred_client = _DummyFredClient()
 
     async def get_snapshot(self, symbol: str):
@@ -29,8 +36,7 @@ class _DummyBaseDataService:
                 "prices_history": self._spy_history[-160:],
                 "vix": None,
             }
-        # Other trend indexes get synthetic rising prices
-        prices = [100.0 + (i * 0.5) for i in range(len(self._spy_history))]
+        prices = self._index_history
         return {
             "underlying_price": prices[-1] if prices else None,
             "prices_history": prices[-160:],
@@ -39,7 +45,7 @@ class _DummyBaseDataService:
     async def get_prices_history(self, symbol: str, lookback_days: int = 365):
         if symbol.upper() == "SPY":
             return self._spy_history
-        return [100.0 + (i * 0.5) for i in range(len(self._spy_history))]
+        return self._index_history
 
     def _mark_success(self, *_args, **_kwargs):
         return None
@@ -51,46 +57,40 @@ class _DummyBaseDataService:
         return {}
 
 
-class RegimeTrendTests(unittest.IsolatedAsyncioTestCase):
-    async def test_trend_inputs_and_signals_present_with_full_history(self):
-        prices = [400.0 + (i * 1.0) for i in range(260)]
-        svc = RegimeService(base_data_service=_DummyBaseDataService(prices), cache=_DummyCache())
-        async def _no_fred(*_args, **_kwargs):
-            return []
-        svc._fred_recent_values = _no_fred
-
-        payload = await svc._compute()
-        trend = payload.get("components", {}).get("trend", {})
-
-        self.assertIn("raw_points", trend)
-        self.assertIn("inputs", trend)
-        self.assertIn("signals", trend)
-        self.assertGreater(float(trend.get("score") or 0.0), 0.0)
-        self.assertGreater(len(trend.get("signals") or []), 0)
-
-        inputs = trend.get("inputs") or {}
-        # Multi-index: inputs keyed by symbol, each with per-MA fields
-        self.assertIn("SPY", inputs)
-        for key in ("close", "ema20", "ema50", "sma50", "sma200"):
-            self.assertIn(key, inputs["SPY"])
-
-    async def test_trend_partial_scoring_with_insufficient_history(self):
-        prices = [500.0 + (i * 1.0) for i in range(80)]
-        svc = RegimeService(base_data_service=_DummyBaseDataService(prices), cache=_DummyCache())
-        async def _no_fred(*_args, **_kwargs):
-            return []
-        svc._fred_recent_values = _no_fred
-
-        payload = await svc._compute()
-        trend = payload.get("components", {}).get("trend", {})
-        inputs = trend.get("inputs") or {}
-
-        # With only 80 prices, SMA200 won't be calculable for any index
-        spy_inputs = inputs.get("SPY", {})
-        self.assertIsNone(spy_inputs.get("sma200"))
-        # Trend score should still be positive (EMA20/EMA50 are available)
-        self.assertGreater(float(trend.get("score") or 0.0), 0.0)
-
-
-if __name__ == "__main__":
-    unittest.main()
+def _service(spy_history):
+    svc = RegimeService(base_data_service=_DummyBaseDataService(spy_history), cache=_DummyCache())
+    async def _no_fred(*_args, **_kwargs):
+        return []
+    svc._fred_recent_values = _no_fred
+    return svc
+
+
+# Driven through the session-scoped ``run_async`` runner (see conftest.py)
+# rather than IsolatedAsyncioTestCase, which builds a new loop per test.
+def test_trend_inputs_and_signals_present_with_full_history(run_async):
+    payload = run_async(_service(_SPY_RISING_260)._compute())
+    trend = payload.get("components", {}).get("trend", {})
+
+    assert "raw_points" in trend
+    assert "inputs" in trend
+    assert "signals" in trend
+    assert float(trend.get("score") or 0.0) > 0.0
+    assert len(trend.get("signals") or []) > 0
+
+    inputs = trend.get("inputs") or {}
+    # Multi-index: inputs keyed by symbol, each with per-MA fields
+    assert "SPY" in inputs
+    for key in ("close", "ema20", "ema50", "sma50", "sma200"):
+        assert key in inputs["SPY"]
+
+
+def test_trend_partial_scoring_with_insufficient_history(run_async):
+    payload = run_async(_service(_SPY_RISING_80)._compute())
+    trend = payload.get("components", {}).get("trend", {})
+    inputs = trend.get("inputs") or {}
+
+    # With only 80 prices, SMA200 won't be calculable for any index
+    spy_inputs = inputs.get("SPY", {})
+    assert spy_inputs.get("sma200") is None
+    # Trend score should still be positive (EMA20/EMA50 are available)
+    assert float(trend.get("score") or 0.0) > 0.0
@@ -7,7 +7,7 @@ from typing import Any
 
 import pytest
 
-from app.utils.report_conformance import is_conforming_report, validate_report_file
+from app.utils.report_conformance import is_conforming_report, load_conforming_report, validate_report_file
 
 
 # ---------------------------------------------------------------------------
@@ -73,34 +73,47 @@ class TestIsConformingReport:
 # validate_report_file
 # ---------------------------------------------------------------------------
 
+_GOOD_REPORT: dict[str, Any] = {
+    "trades": [
+        {
+            "trade_key": "SPY|2026-03-20|put_credit_spread|580|575|5",
+            "strategy_id": "put_credit_spread",
+            "computed": {},
+            "details": {},
+            "pills": {},
+        }
+    ]
+}
+
+# Report payloads serialized once at import; tests write the bytes as-is.
+_REPORT_BYTES: dict[str, bytes] = {
+    name: json.dumps(data).encode("utf-8")
+    for name, data in {
+        "good": _GOOD_REPORT,
+        "non_canonical": {"trades": [{"spread_type": "put_credit_spread"}]},
+        "empty_trades": {"trades": []},
+        "list_top_level": [{"spread_type": "x"}],
+    }.items()
+}
+
+
 class TestValidateReportFile:
     """Integration tests for file-level validation."""
 
-    def _write(self, path: Path, data: Any) -> None:
-        path.write_text(json.dumps(data), encoding="utf-8")
+    def _write(self, path: Path, name: str) -> None:
+        path.write_bytes(_REPORT_BYTES[name])
 
     def test_conforming_file_returned(self, tmp_path: Path):
         p = tmp_path / "good.json"
-        report = {
-            "trades": [
-                {
-                    "trade_key": "SPY|2026-03-20|put_credit_spread|580|575|5",
-                    "strategy_id": "put_credit_spread",
-                    "computed": {},
-                    "details": {},
-                    "pills": {},
-                }
-            ]
-        }
-        self._write(p, report)
+        self._write(p, "good")
         result = validate_report_file(p)
         assert result is not None
-        assert result["trades"][0]["trade_key"] == report["trades"][0]["trade_key"]
+        assert result["trades"][0]["trade_key"] == _GOOD_REPORT["trades"][0]["trade_key"]
         assert p.exists()  # not deleted
 
     def test_non_conforming_file_deleted(self, tmp_path: Path):
         p = tmp_path / "bad.json"
-        self._write(p, {"trades": [{"spread_type": "put_credit_spread"}]})
+        self._write(p, "non_canonical")
         result = validate_report_file(p)
         assert result is None
         assert not p.exists()
@@ -112,6 +125,16 @@ class TestValidateReportFile:
         assert result is None
         assert not p.exists()
 
+    def test_nan_values_still_load(self, tmp_path: Path):
+        """json.dumps writes bare NaN; such reports must not be treated as corrupt."""
+        report = {"strategyId": "put_credit_spread", **_GOOD_REPORT}
+        report["trades"] = [{**_GOOD_REPORT["trades"][0], "computed": {"ev": float("nan")}}]
+        p = tmp_path / "nan.json"
+        p.write_text(json.dumps(report), encoding="utf-8")
+        result = validate_report_file(p)
+        assert result is not None
+        assert p.exists()
+
     def test_missing_file_returns_none(self, tmp_path: Path):
         p = tmp_path / "missing.json"
         result = validate_report_file(p)
@@ -119,7 +142,7 @@ class TestValidateReportFile:
 
     def test_auto_delete_false_keeps_file(self, tmp_path: Path):
         p = tmp_path / "bad.json"
-        self._write(p, {"trades": []})
+        self._write(p, "empty_trades")
         result = validate_report_file(p, auto_delete=False)
         assert result is None
         assert p.exists()  # not deleted
@@ -135,7 +158,7 @@ class TestValidateReportFile:
 
         ve = FakeVE()
         p = tmp_path / "legacy.json"
-        self._write(p, [{"spread_type": "x"}])  # list top-level
+        self._write(p, "list_top_level")
         result = validate_report_file(p, validation_events=ve)
         assert result is None
         assert len(ve.events) == 1
@@ -144,7 +167,28 @@ class TestValidateReportFile:
 
     def test_empty_trades_are_non_conforming(self, tmp_path: Path):
         p = tmp_path / "empty.json"
-        self._write(p, {"trades": []})
+        self._write(p, "empty_trades")
         result = validate_report_file(p)
         assert result is None
         assert not p.exists()
+
+
+class TestLoadConformingReport:
+    """The cacheable loader never deletes or reports; it just declines."""
+
+    def test_conforming_file_returned(self, tmp_path: Path):
+        p = tmp_path / "good.json"
+        p.write_bytes(_REPORT_BYTES["good"])
+        result = load_conforming_report(p)
+        assert result is not None
+        assert result["report_status"] == "ok"
+
+    @pytest.mark.parametrize("name", ["non_canonical", "empty_trades", "list_top_level"])
+    def test_non_conforming_file_kept(self, tmp_path: Path, name: str):
+        p = tmp_path / "bad.json"
+        p.write_bytes(_REPORT_BYTES[name])
+        assert load_conforming_report(p) is None
+        assert p.exists()
+
+    def test_missing_file_returns_none(self, tmp_path: Path):
+        assert load_conforming_report(tmp_path / "missing.json") is None
@@ -0,0 +1,125 @@
+"""Tests for the report listing and loading caches in routes_reports."""
+from __future__ import annotations
+
+import json
+import os
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routes_reports import (
+    _REPORT_LIST_CACHE,
+    _invalidate_report_list,
+    _list_report_files,
+    _load_conforming_report_cached,
+    router,
+)
+
+
+def _touch(path) -> None:
+    path.write_text("{}", encoding="utf-8")
+
+
+def test_missing_dir_lists_nothing(tmp_path):
+    assert _list_report_files(tmp_path / "absent") == []
+
+
+def test_lists_reports_newest_first_and_ignores_other_files(tmp_path):
+    _touch(tmp_path / "analysis_20260101_090000.json")
+    _touch(tmp_path / "analysis_20260301_090000.json")
+    _touch(tmp_path / "validation_events.jsonl")
+    _touch(tmp_path / "analysis_20260201_090000.txt")
+
+    assert _list_report_files(tmp_path) == [
+        "analysis_20260301_090000.json",
+        "analysis_20260101_090000.json",
+    ]
+
+
+def test_cache_refreshes_when_directory_mtime_changes(tmp_path):
+    _touch(tmp_path / "analysis_20260101_090000.json")
+    assert _list_report_files(tmp_path) == ["analysis_20260101_090000.json"]
+
+    # A cache entry from an older directory mtime is stale and rescanned.
+    mtime_ns = _REPORT_LIST_CACHE[tmp_path][0]
+    _REPORT_LIST_CACHE[tmp_path] = (mtime_ns - 1, ["analysis_stale.json"])
+    assert _list_report_files(tmp_path) == ["analysis_20260101_090000.json"]
+
+
+def test_invalidate_rescans_within_same_mtime_tick(tmp_path):
+    _touch(tmp_path / "analysis_20260101_090000.json")
+    cached = _list_report_files(tmp_path)
+    _touch(tmp_path / "analysis_20260102_090000.json")
+    # Coarse timestamps: the write landed in the same mtime tick as the scan.
+    _REPORT_LIST_CACHE[tmp_path] = (tmp_path.stat().st_mtime_ns, cached)
+    assert _list_report_files(tmp_path) == ["analysis_20260101_090000.json"]
+
+    _invalidate_report_list(tmp_path)
+
+    assert _list_report_files(tmp_path) == [
+        "analysis_20260102_090000.json",
+        "analysis_20260101_090000.json",
+    ]
+
+
+def test_generate_invalidates_report_list(tmp_path):
+    _touch(tmp_path / "analysis_20260101_090000.json")
+
+    class _WritingReportService:
+        async def generate_live_report(self, symbol, progress_callback=None):
+            cached = list(_REPORT_LIST_CACHE[tmp_path][1])
+            _touch(tmp_path / "analysis_20260102_090000.json")
+            _REPORT_LIST_CACHE[tmp_path] = (tmp_path.stat().st_mtime_ns, cached)
+            return {"filename": "analysis_20260102_090000.json"}
+
+    app = FastAPI()
+    app.include_router(router)
+    app.state.results_dir = tmp_path
+    app.state.report_service = _WritingReportService()
+    client = TestClient(app)
+
+    assert client.get("/api/reports").json() == ["analysis_20260101_090000.json"]
+    stream = client.get("/api/generate")
+    assert "event: done" in stream.text
+
+    assert client.get("/api/reports").json() == [
+        "analysis_20260102_090000.json",
+        "analysis_20260101_090000.json",
+    ]
+
+
+def test_unchanged_directory_serves_cached_list(tmp_path):
+    _touch(tmp_path / "analysis_20260101_090000.json")
+    _list_report_files(tmp_path)
+    mtime_ns = _REPORT_LIST_CACHE[tmp_path][0]
+    _REPORT_LIST_CACHE[tmp_path] = (mtime_ns, ["analysis_cached.json"])
+
+    assert _list_report_files(tmp_path) == ["analysis_cached.json"]
+
+
+def test_limit_returns_newest_reports(tmp_path):
+    for day in ("01", "02", "03"):
+        _touch(tmp_path / f"analysis_202601{day}_090000.json")
+
+    assert _list_report_files(tmp_path, limit=2) == [
+        "analysis_20260103_090000.json",
+        "analysis_20260102_090000.json",
+    ]
+    # Served from cache; the limit must not truncate the cached list.
+    assert len(_list_report_files(tmp_path)) == 3
+
+
+def test_conforming_report_parsed_once_per_mtime(tmp_path):
+    path = tmp_path / "analysis_20260101_090000.json"
+    path.write_text(json.dumps({
+        "trades": [{"trade_key": "k", "strategy_id": "put_credit_spread", "computed": {}, "details": {}, "pills": {}}],
+    }), encoding="utf-8")
+    mtime_ns = path.stat().st_mtime_ns
+
+    first = _load_conforming_report_cached(path, mtime_ns)
+    assert first is not None
+    assert _load_conforming_report_cached(path, mtime_ns) is first
+
+    path.write_text(json.dumps({"trades": []}), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+    assert _load_conforming_report_cached(path, path.stat().st_mtime_ns) is None
@@ -5,6 +5,9 @@ import pytest
 from app.api.routes_reports import _normalize_report_trade
 from app.utils.computed_metrics import CORE_COMPUTED_METRIC_FIELDS
 
+_CORE_CM_SET = frozenset(CORE_COMPUTED_METRIC_FIELDS)
+_REQUIRED_PILL_KEYS = frozenset(("strategy_label", "dte", "pop", "oi", "vol", "regime_label"))
+
 
 @pytest.mark.parametrize(
     ("row", "expected_strategy_id", "expected_label"),
@@ -63,7 +66,7 @@ def test_reports_trade_normalization_includes_canonical_pills(row: dict, expecte
 
     pills = normalized.get("pills")
     assert isinstance(pills, dict)
-    assert set(["strategy_label", "dte", "pop", "oi", "vol", "regime_label"]).issubset(set(pills.keys()))
+    assert _REQUIRED_PILL_KEYS.issubset(pills)
     assert pills["strategy_label"] == expected_label
 
     warnings = normalized.get("validation_warnings") if isinstance(normalized.get("validation_warnings"), list) else []
@@ -71,10 +74,10 @@ def test_reports_trade_normalization_includes_canonical_pills(row: dict, expecte
     metrics_status = normalized.get("metrics_status")
     assert isinstance(computed_metrics, dict)
     assert isinstance(metrics_status, dict)
-    assert set(CORE_COMPUTED_METRIC_FIELDS).issubset(set(computed_metrics.keys()))
+    assert _CORE_CM_SET.issubset(computed_metrics)
     assert isinstance(metrics_status.get("ready"), bool)
     assert isinstance(metrics_status.get("missing_fields"), list)
-    assert set(metrics_status.get("missing_fields") or []).issubset(set(CORE_COMPUTED_METRIC_FIELDS))
+    assert set(metrics_status.get("missing_fields") or []).issubset(_CORE_CM_SET)
 
     if pills.get("regime_label") is None:
         assert "REGIME_UNAVAILABLE" in warnings
@@ -11,18 +11,12 @@ Covers:
 
 from __future__ import annotations
 
-import sys
 import types
-from pathlib import Path
 from typing import Any
 from unittest.mock import patch
 
 import pytest
 
-BACKEND_ROOT = Path(__file__).resolve().parent.parent
-if str(BACKEND_ROOT) not in sys.path:
-    sys.path.insert(0, str(BACKEND_ROOT))
-
 from app.utils.candidate_sampler import (
     BYPASS_HIGH_WATER_MARK,
     compute_pre_score,
@@ -9,15 +9,10 @@ from __future__ import annotations
 
 import asyncio
 import copy
-import sys
-from pathlib import Path
 from typing import Any
 
 import pytest
 
-# Ensure the backend package is importable
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 from app.services.stock_engine_service import (
     StockEngineService,
     _sort_key,
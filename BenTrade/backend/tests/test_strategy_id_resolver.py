@@ -1,6 +1,6 @@
 """Tests for strategy_id_resolver — the single canonical entry-point."""
 
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -13,42 +13,44 @@ from app.utils.strategy_id_resolver import (
 from app.utils.trade_key import CANONICAL_STRATEGY_IDS
 
 
+# Parametrize tables, sorted once so test ids are stable across runs.
+_CANONICAL_SORTED = tuple(sorted(CANONICAL_STRATEGY_IDS))
+_KNOWN_ALIAS_ITEMS = tuple(sorted((k, v) for k, v in _STRATEGY_ALIASES.items() if k != v))
+
+
+@pytest.fixture
+def mock_emit(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Swap ``_emit_alias_event`` for a fresh MagicMock for one test."""
+    m = MagicMock()
+    monkeypatch.setattr("app.utils.strategy_id_resolver._emit_alias_event", m)
+    return m
+
+
 # ── canonical pass-through ───────────────────────────────────────────
 
 
-@pytest.mark.parametrize("sid", sorted(CANONICAL_STRATEGY_IDS))
-def test_canonical_ids_pass_through(sid: str) -> None:
+@pytest.mark.parametrize("sid", _CANONICAL_SORTED)
+def test_canonical_ids_pass_through(sid: str, mock_emit: MagicMock) -> None:
     """Every canonical strategy_id must resolve to itself with no event."""
-    with patch(
-        "app.utils.strategy_id_resolver._emit_alias_event"
-    ) as mock_emit:
-        result = resolve_strategy_id(sid)
+    result = resolve_strategy_id(sid)
     assert result == sid
     mock_emit.assert_not_called()
 
 
 # ── alias mapping with WARN event ───────────────────────────────────
 
-_KNOWN_ALIASES = {k: v for k, v in _STRATEGY_ALIASES.items() if k != v}
-
 
-@pytest.mark.parametrize("alias,expected", sorted(_KNOWN_ALIASES.items()))
-def test_alias_mapping_emits_event(alias: str, expected: str) -> None:
+@pytest.mark.parametrize("alias,expected", _KNOWN_ALIAS_ITEMS)
+def test_alias_mapping_emits_event(alias: str, expected: str, mock_emit: MagicMock) -> None:
     """Known aliases resolve correctly and emit STRATEGY_ALIAS_USED."""
-    with patch(
-        "app.utils.strategy_id_resolver._emit_alias_event"
-    ) as mock_emit:
-        result = resolve_strategy_id(alias)
+    result = resolve_strategy_id(alias)
     assert result == expected
     mock_emit.assert_called_once_with(alias, expected)
 
 
-def test_alias_mapping_emit_event_false() -> None:
+def test_alias_mapping_emit_event_false(mock_emit: MagicMock) -> None:
     """When emit_event=False, no validation event should fire."""
-    with patch(
-        "app.utils.strategy_id_resolver._emit_alias_event"
-    ) as mock_emit:
-        result = resolve_strategy_id("credit_put_spread", emit_event=False)
+    result = resolve_strategy_id("credit_put_spread", emit_event=False)
     assert result == "put_credit_spread"
     mock_emit.assert_not_called()
 
@@ -17,6 +17,12 @@ from typing import Any
 
 import pytest
 
+from app.services.strategies.butterflies import ButterfliesStrategyPlugin
+from app.services.strategies.calendars import CalendarsStrategyPlugin
+from app.services.strategies.debit_spreads import DebitSpreadsStrategyPlugin
+from app.services.strategies.income import IncomeStrategyPlugin
+from app.services.strategies.iron_condor import IronCondorStrategyPlugin
+
 
 # ────────────────────────────────────────────────────────────
 # Helpers
@@ -32,8 +38,12 @@ def _make_leg(**kwargs: Any) -> SimpleNamespace:
     return SimpleNamespace(**defaults)
 
 
+_SQRT2 = math.sqrt(2.0)
+
+
 def _normal_cdf(x: float) -> float:
-    return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
+    # erfc keeps precision in the far left tail, where 1 + erf(x) cancels.
+    return 0.5 * math.erfc(-x / _SQRT2)
 
 
 # ────────────────────────────────────────────────────────────
@@ -43,13 +53,13 @@ def _normal_cdf(x: float) -> float:
 class TestButterflyMetrics:
     """Validate butterfly POP, break-even, EV, and minimum debit guard."""
 
-    @pytest.fixture()
+    @pytest.fixture(scope="module")
     def plugin(self):
-        from app.services.strategies.butterflies import ButterfliesStrategyPlugin
         return ButterfliesStrategyPlugin()
 
+    @staticmethod
     def _debit_butterfly_candidate(
-        self, *, spot: float = 100.0, center: float = 100.0,
+        *, spot: float = 100.0, center: float = 100.0,
         wing: float = 5.0, debit: float = 0.50,
     ) -> dict[str, Any]:
         lower = center - wing
@@ -80,22 +90,29 @@ class TestButterflyMetrics:
             "snapshot": {"symbol": "TEST", "prices_history": []},
         }
 
-    def test_pop_not_100_percent(self, plugin):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def enriched(cls, plugin) -> dict[str, dict[str, Any]]:
+        """Enrich every butterfly case in one ``enrich`` call, keyed by name."""
+        cases = {
+            "standard": cls._debit_butterfly_candidate(spot=100, center=100, wing=5, debit=0.50),
+            "min_debit": cls._debit_butterfly_candidate(spot=100, center=100, wing=5, debit=0.04),
+        }
+        rows = plugin.enrich(list(cases.values()), {"policy": {}})
+        # enricher keeps invalid rows (marked) so evaluate can reject them
+        assert len(rows) == len(cases)
+        return dict(zip(cases, rows))
+
+    def test_pop_not_100_percent(self, enriched):
         """POP must be < 1.0 for any realistic butterfly."""
-        candidate = self._debit_butterfly_candidate(spot=100, center=100, wing=5, debit=0.50)
-        enriched = plugin.enrich([candidate], {"policy": {}})
-        assert len(enriched) >= 1
-        trade = enriched[0]
+        trade = enriched["standard"]
         pop = trade["p_win_used"]
         assert pop < 1.0, f"POP should be < 1.0, got {pop}"
         assert pop > 0.0, f"POP should be > 0.0, got {pop}"
 
-    def test_break_evens_span_wing_width(self, plugin):
+    def test_break_evens_span_wing_width(self, enriched):
         """Break-evens should span nearly the full wing width, not ±debit."""
-        candidate = self._debit_butterfly_candidate(spot=100, center=100, wing=5, debit=0.50)
-        enriched = plugin.enrich([candidate], {"policy": {}})
-        assert len(enriched) >= 1
-        trade = enriched[0]
+        trade = enriched["standard"]
         be_low = trade["break_even_low"]
         be_high = trade["break_even_high"]
         # Correct: lower + debit = 95 + 0.50 = 95.50
@@ -105,32 +122,24 @@ class TestButterflyMetrics:
         assert profit_zone > 5.0, f"Profit zone too narrow: {profit_zone:.2f}"
         assert profit_zone < 10.0, f"Profit zone unreasonably wide: {profit_zone:.2f}"
 
-    def test_ev_is_numerical_integral(self, plugin):
+    def test_ev_is_numerical_integral(self, enriched):
         """EV should be a real number, not a weighted average around center."""
-        candidate = self._debit_butterfly_candidate(spot=100, center=100, wing=5, debit=0.50)
-        enriched = plugin.enrich([candidate], {"policy": {}})
-        assert len(enriched) >= 1
-        trade = enriched[0]
+        trade = enriched["standard"]
         ev = trade["expected_value"]
         assert ev is not None
         # EV should be finite and reasonable
         assert -1000 < ev < 5000, f"EV out of range: {ev}"
 
-    def test_min_debit_guard_filters_cheap_trades(self, plugin):
+    def test_min_debit_guard_filters_cheap_trades(self, enriched):
         """Trades with debit < $0.05/share must be marked execution_invalid."""
-        candidate = self._debit_butterfly_candidate(spot=100, center=100, wing=5, debit=0.04)
-        enriched = plugin.enrich([candidate], {"policy": {}})
+        trade = enriched["min_debit"]
         # enricher now keeps the row but marks it invalid so evaluate rejects it
-        assert len(enriched) >= 1
-        assert enriched[0]["execution_invalid"] is True
-        assert enriched[0]["rank_score"] == 0.0
+        assert trade["execution_invalid"] is True
+        assert trade["rank_score"] == 0.0
 
-    def test_pop_uses_normal_cdf(self, plugin):
+    def test_pop_uses_normal_cdf(self, enriched):
         """POP should match the analytical normal CDF between break-evens."""
-        candidate = self._debit_butterfly_candidate(spot=100, center=100, wing=5, debit=0.50)
-        enriched = plugin.enrich([candidate], {"policy": {}})
-        assert len(enriched) >= 1
-        trade = enriched[0]
+        trade = enriched["standard"]
         # Independently verify: POP = Φ((BE_high - spot)/EM) - Φ((BE_low - spot)/EM)
         em = 100 * 0.05  # 5.0
         be_low = trade["break_even_low"]
@@ -140,12 +149,9 @@ class TestButterflyMetrics:
             f"POP {trade['p_win_used']:.4f} != expected {expected_pop:.4f}"
         )
 
-    def test_touch_center_preserved_separately(self, plugin):
+    def test_touch_center_preserved_separately(self, enriched):
         """probability_of_touch_center should still exist as supplementary metric."""
-        candidate = self._debit_butterfly_candidate(spot=100, center=100, wing=5, debit=0.50)
-        enriched = plugin.enrich([candidate], {"policy": {}})
-        assert len(enriched) >= 1
-        trade = enriched[0]
+        trade = enriched["standard"]
         assert "probability_of_touch_center" in trade
         # Touch center and POP should be different values
         assert trade["probability_of_touch_center"] != trade["p_win_used"] or trade["p_win_used"] < 1.0
@@ -158,13 +164,13 @@ class TestButterflyMetrics:
 class TestIronCondorMetrics:
     """Validate iron condor POP via CDF and real EV."""
 
-    @pytest.fixture()
+    @pytest.fixture(scope="module")
     def plugin(self):
-        from app.services.strategies.iron_condor import IronCondorStrategyPlugin
         return IronCondorStrategyPlugin()
 
+    @staticmethod
     def _condor_candidate(
-        self, *, spot: float = 100.0,
+        *, spot: float = 100.0,
         put_short: float = 90.0, put_long: float = 85.0,
         call_short: float = 110.0, call_long: float = 115.0,
         credit: float = 1.50,
@@ -199,12 +205,16 @@ class TestIronCondorMetrics:
             "snapshot": {"symbol": "TEST", "prices_history": []},
         }
 
-    def test_pop_via_normal_cdf(self, plugin):
-        """POP should match P(short_put < S_T < short_call) using conservative sigma."""
-        candidate = self._condor_candidate(spot=100, put_short=90, call_short=110, credit=1.50)
-        enriched = plugin.enrich([candidate], {"request": {}, "policy": {}})
+    @pytest.fixture(scope="class")
+    @classmethod
+    def trade(cls, plugin) -> dict[str, Any]:
+        """Enrich the default candidate once; the tests only read the row."""
+        enriched = plugin.enrich([cls._condor_candidate()], {"request": {}, "policy": {}})
         assert len(enriched) >= 1
-        trade = enriched[0]
+        return enriched[0]
+
+    def test_pop_via_normal_cdf(self, trade):
+        """POP should match P(short_put < S_T < short_call) using conservative sigma."""
         pop = trade["p_win_used"]
         # Verify against independent CDF calculation using short strikes.
         # POP = CDF(z_call) - CDF(z_put)
@@ -215,12 +225,8 @@ class TestIronCondorMetrics:
         expected_pop = _normal_cdf((110 - 100) / sigma) - _normal_cdf((90 - 100) / sigma)
         assert abs(pop - expected_pop) < 0.05, f"POP {pop:.4f} != expected {expected_pop:.4f}"
 
-    def test_ev_is_real_not_rank_derived(self, plugin):
+    def test_ev_is_real_not_rank_derived(self, trade):
         """EV must NOT be rank_score * 0.20 — must be pop * profit - (1-pop) * loss."""
-        candidate = self._condor_candidate()
-        enriched = plugin.enrich([candidate], {"request": {}, "policy": {}})
-        assert len(enriched) >= 1
-        trade = enriched[0]
         assert "ev_per_contract" in trade
         assert "ev_per_share" in trade
         assert "expected_value" in trade
@@ -230,12 +236,8 @@ class TestIronCondorMetrics:
             "EV should not be derived from rank_score"
         )
 
-    def test_ev_to_risk_consistent(self, plugin):
+    def test_ev_to_risk_consistent(self, trade):
         """ev_to_risk should equal ev_per_contract / max_loss."""
-        candidate = self._condor_candidate()
-        enriched = plugin.enrich([candidate], {"request": {}, "policy": {}})
-        assert len(enriched) >= 1
-        trade = enriched[0]
         max_loss = trade["max_loss"]
         if max_loss > 0:
             expected_ratio = trade["ev_per_contract"] / max_loss
@@ -249,12 +251,12 @@ class TestIronCondorMetrics:
 class TestIncomeMetrics:
     """Validate income EV is POP-derived, not rank_score placeholder."""
 
-    @pytest.fixture()
+    @pytest.fixture(scope="module")
     def plugin(self):
-        from app.services.strategies.income import IncomeStrategyPlugin
         return IncomeStrategyPlugin()
 
-    def _csp_candidate(self, *, spot: float = 100.0, strike: float = 90.0) -> dict[str, Any]:
+    @staticmethod
+    def _csp_candidate(*, spot: float = 100.0, strike: float = 90.0) -> dict[str, Any]:
         return {
             "strategy": "income",
             "spread_type": "csp",
@@ -271,12 +273,16 @@ class TestIncomeMetrics:
             "snapshot": {"symbol": "TEST", "prices_history": [float(100 + i * 0.1) for i in range(30)]},
         }
 
-    def test_ev_is_pop_derived(self, plugin):
-        """EV = pop * max_profit - (1-pop) * max_loss, not rank_score - 0.5."""
-        candidate = self._csp_candidate(spot=100, strike=90)
-        enriched = plugin.enrich([candidate], {"request": {}, "policy": {}})
+    @pytest.fixture(scope="class")
+    @classmethod
+    def trade(cls, plugin) -> dict[str, Any]:
+        """Enrich the default candidate once; the tests only read the row."""
+        enriched = plugin.enrich([cls._csp_candidate()], {"request": {}, "policy": {}})
         assert len(enriched) >= 1
-        trade = enriched[0]
+        return enriched[0]
+
+    def test_ev_is_pop_derived(self, trade):
+        """EV = pop * max_profit - (1-pop) * max_loss, not rank_score - 0.5."""
         pop = trade["p_win_used"]
         max_profit = trade["max_profit"]
         max_loss = trade["max_loss"]
@@ -285,12 +291,8 @@ class TestIncomeMetrics:
             f"EV {trade['ev_per_contract']:.2f} != expected {expected_ev:.2f}"
         )
 
-    def test_ev_not_rank_score_placeholder(self, plugin):
+    def test_ev_not_rank_score_placeholder(self, trade):
         """EV must not be (rank_score - 0.5) * 100."""
-        candidate = self._csp_candidate()
-        enriched = plugin.enrich([candidate], {"request": {}, "policy": {}})
-        assert len(enriched) >= 1
-        trade = enriched[0]
         rank_placeholder = (trade["rank_score"] - 0.5) * 100.0
         assert trade["ev_per_contract"] != pytest.approx(rank_placeholder, abs=0.5), (
             "EV should not be derived from rank_score"
@@ -304,12 +306,12 @@ class TestIncomeMetrics:
 class TestCalendarMetrics:
     """Validate calendars emit None for unknowable metrics."""
 
-    @pytest.fixture()
+    @pytest.fixture(scope="module")
     def plugin(self):
-        from app.services.strategies.calendars import CalendarsStrategyPlugin
         return CalendarsStrategyPlugin()
 
-    def _calendar_candidate(self, *, spot: float = 100.0, strike: float = 100.0) -> dict[str, Any]:
+    @staticmethod
+    def _calendar_candidate(*, spot: float = 100.0, strike: float = 100.0) -> dict[str, Any]:
         return {
             "strategy": "calendar_spread",
             "spread_type": "calendar_call_spread",
@@ -331,45 +333,35 @@ class TestCalendarMetrics:
             "far_snapshot": {"symbol": "TEST"},
         }
 
-    def test_max_profit_is_none(self, plugin):
-        """max_profit cannot be computed without an options pricing model."""
-        candidate = self._calendar_candidate()
-        enriched = plugin.enrich([candidate], {"request": {}, "policy": {}})
+    @pytest.fixture(scope="class")
+    @classmethod
+    def trade(cls, plugin) -> dict[str, Any]:
+        """Enrich the default candidate once; the tests only read the row."""
+        enriched = plugin.enrich([cls._calendar_candidate()], {"request": {}, "policy": {}})
         assert len(enriched) >= 1
-        trade = enriched[0]
+        return enriched[0]
+
+    def test_max_profit_is_none(self, trade):
+        """max_profit cannot be computed without an options pricing model."""
         assert trade["max_profit"] is None
         assert trade["max_profit_per_contract"] is None
 
-    def test_return_on_risk_is_none(self, plugin):
+    def test_return_on_risk_is_none(self, trade):
         """return_on_risk depends on unknowable max_profit; must be None."""
-        candidate = self._calendar_candidate()
-        enriched = plugin.enrich([candidate], {"request": {}, "policy": {}})
-        assert len(enriched) >= 1
-        assert enriched[0]["return_on_risk"] is None
+        assert trade["return_on_risk"] is None
 
-    def test_ev_is_none(self, plugin):
+    def test_ev_is_none(self, trade):
         """EV cannot be computed without POP and max_profit; must be None."""
-        candidate = self._calendar_candidate()
-        enriched = plugin.enrich([candidate], {"request": {}, "policy": {}})
-        assert len(enriched) >= 1
-        trade = enriched[0]
         assert trade["ev_per_contract"] is None
         assert trade["ev_per_share"] is None
         assert trade["expected_value"] is None
 
-    def test_pop_is_none(self, plugin):
+    def test_pop_is_none(self, trade):
         """POP for calendars is unknowable; must be None."""
-        candidate = self._calendar_candidate()
-        enriched = plugin.enrich([candidate], {"request": {}, "policy": {}})
-        assert len(enriched) >= 1
-        assert enriched[0]["p_win_used"] is None
+        assert trade["p_win_used"] is None
 
-    def test_max_loss_is_debit(self, plugin):
+    def test_max_loss_is_debit(self, trade):
         """max_loss IS computable: it's the net debit paid."""
-        candidate = self._calendar_candidate()
-        enriched = plugin.enrich([candidate], {"request": {}, "policy": {}})
-        assert len(enriched) >= 1
-        trade = enriched[0]
         assert trade["max_loss"] is not None
         assert trade["max_loss"] > 0
 
@@ -381,12 +373,12 @@ class TestCalendarMetrics:
 class TestDebitSpreadMetrics:
     """Verify debit spread metrics are real (existing plugin was already correct)."""
 
-    @pytest.fixture()
+    @pytest.fixture(scope="module")
     def plugin(self):
-        from app.services.strategies.debit_spreads import DebitSpreadsStrategyPlugin
         return DebitSpreadsStrategyPlugin()
 
-    def _call_debit_candidate(self) -> dict[str, Any]:
+    @staticmethod
+    def _call_debit_candidate() -> dict[str, Any]:
         return {
             "strategy": "call_debit",
             "spread_type": "call_debit",
@@ -402,23 +394,23 @@ class TestDebitSpreadMetrics:
             "snapshot": {"symbol": "TEST", "prices_history": [float(100 + i * 0.05) for i in range(30)]},
         }
 
-    def test_max_profit_per_contract_units(self, plugin):
-        """max_profit should be (width - debit) * 100, already per-contract."""
-        candidate = self._call_debit_candidate()
-        enriched = plugin.enrich([candidate], {"request": {}, "policy": {}})
+    @pytest.fixture(scope="class")
+    @classmethod
+    def trade(cls, plugin) -> dict[str, Any]:
+        """Enrich the default candidate once; the tests only read the row."""
+        enriched = plugin.enrich([cls._call_debit_candidate()], {"request": {}, "policy": {}})
         assert len(enriched) >= 1
-        trade = enriched[0]
+        return enriched[0]
+
+    def test_max_profit_per_contract_units(self, trade):
+        """max_profit should be (width - debit) * 100, already per-contract."""
         # debit = long_ask - short_bid = 4.20 - 2.00 = 2.20
         # max_profit = (5.0 - 2.20) * 100 = 280.0
         assert trade["max_profit"] == pytest.approx(280.0, abs=5.0)
         assert trade["max_profit_per_contract"] == trade["max_profit"]
 
-    def test_pop_from_implied_prob(self, plugin):
+    def test_pop_from_implied_prob(self, trade):
         """POP uses refined model; pop_delta_approx = |delta_long| as baseline."""
-        candidate = self._call_debit_candidate()
-        enriched = plugin.enrich([candidate], {"request": {}, "policy": {}})
-        assert len(enriched) >= 1
-        trade = enriched[0]
         # implied_prob_profit = p_win_used = pop_refined (NOT raw delta)
         assert trade["implied_prob_profit"] == trade["p_win_used"]
         # pop_delta_approx baseline still = |delta_long|
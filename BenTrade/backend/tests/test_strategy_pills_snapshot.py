@@ -1,36 +1,10 @@
 from __future__ import annotations
 
-from pathlib import Path
-
 import pytest
 
 from app.services.strategy_service import StrategyService
 
 
-class _BaseStub:
-    tradier_client = None
-
-    @staticmethod
-    def get_source_health_snapshot() -> dict:
-        return {}
-
-
-class _RiskStub:
-    @staticmethod
-    def get_policy() -> dict:
-        return {}
-
-
-def _svc(tmp_path: Path) -> StrategyService:
-    return StrategyService(
-        base_data_service=_BaseStub(),
-        results_dir=tmp_path,
-        risk_policy_service=_RiskStub(),
-        signal_service=None,
-        regime_service=None,
-    )
-
-
 @pytest.mark.parametrize(
     ("strategy_id", "expiration", "trade", "expected_pills"),
     [
@@ -151,11 +125,11 @@ def _svc(tmp_path: Path) -> StrategyService:
     ],
 )
 def test_strategy_pills_snapshot_contract(
-    tmp_path: Path,
+    strategy_service: StrategyService,
     strategy_id: str,
     expiration: str,
     trade: dict,
     expected_pills: dict,
 ) -> None:
-    row = _svc(tmp_path)._normalize_trade(strategy_id=strategy_id, expiration=expiration, trade=trade)
+    row = strategy_service._normalize_trade(strategy_id=strategy_id, expiration=expiration, trade=trade)
     assert row["pills"] == expected_pills
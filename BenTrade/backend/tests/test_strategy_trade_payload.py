@@ -1,40 +1,16 @@
 from __future__ import annotations
 
-from pathlib import Path
 import pytest
 
 from app.services.strategy_service import StrategyService
 from app.utils.computed_metrics import CORE_COMPUTED_METRIC_FIELDS
 
+_CORE_CM_SET = frozenset(CORE_COMPUTED_METRIC_FIELDS)
+_REQUIRED_PILL_KEYS = frozenset(("strategy_label", "dte", "pop", "oi", "vol", "regime_label"))
 
-class _BaseStub:
-    tradier_client = None
 
-    @staticmethod
-    def get_source_health_snapshot() -> dict:
-        return {}
-
-
-class _RiskStub:
-    @staticmethod
-    def get_policy() -> dict:
-        return {}
-
-
-def _svc(tmp_path: Path) -> StrategyService:
-    return StrategyService(
-        base_data_service=_BaseStub(),
-        results_dir=tmp_path,
-        risk_policy_service=_RiskStub(),
-        signal_service=None,
-        regime_service=None,
-    )
-
-
-def test_normalize_trade_includes_canonical_contract_fields(tmp_path):
-    svc = _svc(tmp_path)
-
-    row = svc._normalize_trade(
+def test_normalize_trade_includes_canonical_contract_fields(strategy_service):
+    row = strategy_service._normalize_trade(
         strategy_id="butterflies",
         expiration="2026-03-20",
         trade={
@@ -56,142 +32,127 @@ def test_normalize_trade_includes_canonical_contract_fields(tmp_path):
     assert "_trade_key" not in row
 
 
+_CONTRACT_DICT_KEYS = ("computed", "details", "pills", "computed_metrics", "metrics_status")
+
+
+def _assert_contract_shape(row: dict) -> tuple[dict, ...]:
+    """Assert the canonical sub-dicts exist and return them in _CONTRACT_DICT_KEYS order."""
+    parts = tuple(row.get(key) for key in _CONTRACT_DICT_KEYS)
+    for key, value in zip(_CONTRACT_DICT_KEYS, parts):
+        assert isinstance(value, dict), f"{key} is {type(value).__name__}, expected dict"
+    return parts
+
+
+# Raw scanner rows, one per strategy family. _normalize_trade does not
+# mutate its input, so the parametrized cases share these dicts.
+_CREDIT_SPREAD_TRADE = {
+    "underlying": "QQQ",
+    "spread_type": "credit_put_spread",
+    "expiration": "2026-03-20",
+    "dte": 31,
+    "short_strike": 510,
+    "long_strike": 500,
+    "max_profit": 145.0,
+    "max_loss": 855.0,
+    "p_win_used": 0.68,
+    "return_on_risk": 0.17,
+    "ev_per_contract": 35.0,
+}
+
+_DEBIT_SPREAD_TRADE = {
+    "underlying": "QQQ",
+    "spread_type": "debit_call_spread",
+    "expiration": "2026-03-20",
+    "dte": 31,
+    "short_strike": 520,
+    "long_strike": 510,
+    "max_profit": 600.0,
+    "max_loss": 400.0,
+    "return_on_risk": 1.5,
+    "ev_per_contract": 40.0,
+}
+
+_BUTTERFLY_TRADE = {
+    "underlying": "QQQ",
+    "spread_type": "debit_call_butterfly",
+    "expiration": "2026-03-20",
+    "dte": 31,
+    "center_strike": 515,
+    "lower_strike": 510,
+    "upper_strike": 520,
+    "max_profit": 480.0,
+    "max_loss": 220.0,
+    "return_on_risk": 2.18,
+    "ev_per_contract": 28.0,
+}
+
+_CALENDAR_TRADE = {
+    "underlying": "QQQ",
+    "spread_type": "calendar_call_spread",
+    "expiration": "2026-04-17",
+    "dte": 59,
+    "dte_near": 31,
+    "dte_far": 59,
+    "short_strike": 515,
+    "long_strike": 515,
+    "max_profit": 280.0,
+    "max_loss": 150.0,
+    "return_on_risk": 1.86,
+    "expected_value": 22.0,
+    "expected_move_near": 12.5,
+}
+
+_IRON_CONDOR_TRADE = {
+    "underlying": "QQQ",
+    "spread_type": "iron_condor",
+    "expiration": "2026-03-20",
+    "dte": 31,
+    "put_short_strike": 505,
+    "put_long_strike": 500,
+    "call_short_strike": 530,
+    "call_long_strike": 535,
+    "max_profit": 220.0,
+    "max_loss": 780.0,
+    "p_win_used": 0.64,
+    "return_on_risk": 0.28,
+    "ev_per_contract": 16.0,
+}
+
+_INCOME_TRADE = {
+    "underlying": "QQQ",
+    "spread_type": "csp",
+    "expiration": "2026-03-20",
+    "dte": 31,
+    "short_strike": 500,
+    "max_profit": 120.0,
+    "max_loss": 4880.0,
+    "p_win_used": 0.72,
+    "return_on_risk": 0.024,
+    "expected_value": 8.0,
+}
+
+
 @pytest.mark.parametrize(
     ("strategy_id", "trade", "expect_pop_warning", "expected_strategy_label"),
     [
-        (
-            "credit_spread",
-            {
-                "underlying": "QQQ",
-                "spread_type": "credit_put_spread",
-                "expiration": "2026-03-20",
-                "dte": 31,
-                "short_strike": 510,
-                "long_strike": 500,
-                "max_profit": 145.0,
-                "max_loss": 855.0,
-                "p_win_used": 0.68,
-                "return_on_risk": 0.17,
-                "ev_per_contract": 35.0,
-            },
-            False,
-            "Put Credit Spread",
-        ),
-        (
-            "debit_spreads",
-            {
-                "underlying": "QQQ",
-                "spread_type": "debit_call_spread",
-                "expiration": "2026-03-20",
-                "dte": 31,
-                "short_strike": 520,
-                "long_strike": 510,
-                "max_profit": 600.0,
-                "max_loss": 400.0,
-                "return_on_risk": 1.5,
-                "ev_per_contract": 40.0,
-            },
-            True,
-            "Call Debit Spread",
-        ),
-        (
-            "butterflies",
-            {
-                "underlying": "QQQ",
-                "spread_type": "debit_call_butterfly",
-                "expiration": "2026-03-20",
-                "dte": 31,
-                "center_strike": 515,
-                "lower_strike": 510,
-                "upper_strike": 520,
-                "max_profit": 480.0,
-                "max_loss": 220.0,
-                "return_on_risk": 2.18,
-                "ev_per_contract": 28.0,
-            },
-            True,
-            "Debit Butterfly",
-        ),
-        (
-            "calendars",
-            {
-                "underlying": "QQQ",
-                "spread_type": "calendar_call_spread",
-                "expiration": "2026-04-17",
-                "dte": 59,
-                "dte_near": 31,
-                "dte_far": 59,
-                "short_strike": 515,
-                "long_strike": 515,
-                "max_profit": 280.0,
-                "max_loss": 150.0,
-                "return_on_risk": 1.86,
-                "expected_value": 22.0,
-                "expected_move_near": 12.5,
-            },
-            True,
-            "Call Calendar Spread",
-        ),
-        (
-            "iron_condor",
-            {
-                "underlying": "QQQ",
-                "spread_type": "iron_condor",
-                "expiration": "2026-03-20",
-                "dte": 31,
-                "put_short_strike": 505,
-                "put_long_strike": 500,
-                "call_short_strike": 530,
-                "call_long_strike": 535,
-                "max_profit": 220.0,
-                "max_loss": 780.0,
-                "p_win_used": 0.64,
-                "return_on_risk": 0.28,
-                "ev_per_contract": 16.0,
-            },
-            False,
-            "Iron Condor",
-        ),
-        (
-            "income",
-            {
-                "underlying": "QQQ",
-                "spread_type": "csp",
-                "expiration": "2026-03-20",
-                "dte": 31,
-                "short_strike": 500,
-                "max_profit": 120.0,
-                "max_loss": 4880.0,
-                "p_win_used": 0.72,
-                "return_on_risk": 0.024,
-                "expected_value": 8.0,
-            },
-            False,
-            "Cash Secured Put",
-        ),
+        pytest.param("credit_spread", _CREDIT_SPREAD_TRADE, False, "Put Credit Spread", id="credit_spread"),
+        pytest.param("debit_spreads", _DEBIT_SPREAD_TRADE, True, "Call Debit Spread", id="debit_spreads"),
+        pytest.param("butterflies", _BUTTERFLY_TRADE, True, "Debit Butterfly", id="butterflies"),
+        pytest.param("calendars", _CALENDAR_TRADE, True, "Call Calendar Spread", id="calendars"),
+        pytest.param("iron_condor", _IRON_CONDOR_TRADE, False, "Iron Condor", id="iron_condor"),
+        pytest.param("income", _INCOME_TRADE, False, "Cash Secured Put", id="income"),
     ],
 )
 def test_normalize_trade_contract_has_computed_and_details(
-    tmp_path: Path,
+    strategy_service: StrategyService,
     strategy_id: str,
     trade: dict,
     expect_pop_warning: bool,
     expected_strategy_label: str,
 ) -> None:
-    svc = _svc(tmp_path)
-    row = svc._normalize_trade(strategy_id=strategy_id, expiration=str(trade.get("expiration") or "2026-03-20"), trade=trade)
-
-    assert isinstance(row.get("computed"), dict)
-    assert isinstance(row.get("details"), dict)
-    assert isinstance(row.get("pills"), dict)
-    assert isinstance(row.get("computed_metrics"), dict)
-    assert isinstance(row.get("metrics_status"), dict)
-
-    computed = row["computed"]
-    details = row["details"]
-    pills = row["pills"]
-    computed_metrics = row["computed_metrics"]
-    metrics_status = row["metrics_status"]
+    row = strategy_service._normalize_trade(strategy_id=strategy_id, expiration=str(trade.get("expiration") or "2026-03-20"), trade=trade)
+
+    computed, details, pills, computed_metrics, metrics_status = _assert_contract_shape(row)
     warnings = row.get("validation_warnings") if isinstance(row.get("validation_warnings"), list) else []
 
     assert "max_profit" in computed
@@ -199,7 +160,7 @@ def test_normalize_trade_contract_has_computed_and_details(
     assert "expected_value" in computed
     assert "return_on_risk" in computed
     assert "dte" in details
-    assert set(["strategy_label", "dte", "pop", "oi", "vol", "regime_label"]).issubset(set(pills.keys()))
+    assert _REQUIRED_PILL_KEYS.issubset(pills)
     assert pills["strategy_label"] == expected_strategy_label
     assert pills["pop"] == computed["pop"]
     assert pills["oi"] == computed["open_interest"]
@@ -207,10 +168,10 @@ def test_normalize_trade_contract_has_computed_and_details(
     assert pills["regime_label"] == details["market_regime"]
     assert isinstance(row.get("trade_key"), str) and row["trade_key"]
     assert isinstance(row.get("strategy_id"), str) and row["strategy_id"]
-    assert set(CORE_COMPUTED_METRIC_FIELDS).issubset(set(computed_metrics.keys()))
+    assert _CORE_CM_SET.issubset(computed_metrics)
     assert isinstance(metrics_status.get("ready"), bool)
     assert isinstance(metrics_status.get("missing_fields"), list)
-    assert set(metrics_status.get("missing_fields") or []).issubset(set(CORE_COMPUTED_METRIC_FIELDS))
+    assert set(metrics_status.get("missing_fields") or []).issubset(_CORE_CM_SET)
 
     if computed["max_profit"] is None:
         assert "MAX_PROFIT_UNAVAILABLE" in warnings
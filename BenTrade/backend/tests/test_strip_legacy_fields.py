@@ -11,15 +11,8 @@ Validates that:
 
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-
 import pytest
 
-BACKEND_ROOT = Path(__file__).resolve().parents[1]
-if str(BACKEND_ROOT) not in sys.path:
-    sys.path.insert(0, str(BACKEND_ROOT))
-
 from app.utils.normalize import (
     _LEGACY_FLAT_FIELDS,
     normalize_trade,
@@ -29,7 +22,7 @@ from app.utils.normalize import (
 # ── Constants ─────────────────────────────────────────────────────────
 
 # Canonical root keys that MUST survive stripping.
-_CANONICAL_ROOT_KEYS = {
+_CANONICAL_ROOT_KEYS = frozenset({
     "trade_key",
     "symbol",
     "strategy_id",
@@ -43,7 +36,7 @@ _CANONICAL_ROOT_KEYS = {
     "metrics_status",
     "validation_warnings",
     "computed_metrics",
-}
+})
 
 # The full set of legacy flat fields documented for removal.
 _EXPECTED_LEGACY_FIELDS = frozenset({
@@ -79,31 +72,37 @@ _EXPECTED_LEGACY_FIELDS = frozenset({
 # ── 1. strip_legacy_fields() removes every legacy key ────────────────
 
 
-def test_strip_removes_all_legacy_keys():
-    """Every key in _LEGACY_FLAT_FIELDS is removed from the output."""
+@pytest.fixture(scope="module")
+def stripped_full() -> dict:
+    """Every legacy field plus a couple of canonical keys, stripped once."""
     trade = {field: "dummy" for field in _LEGACY_FLAT_FIELDS}
     # Add a canonical key to make sure we don't accidentally strip everything
     trade["symbol"] = "SPY"
     trade["computed"] = {"pop": 0.72}
+    return strip_legacy_fields(trade)
 
-    result = strip_legacy_fields(trade)
 
-    for field in _LEGACY_FLAT_FIELDS:
-        assert field not in result, f"Legacy field '{field}' was not stripped"
-
-
-def test_strip_preserves_canonical_root_keys():
-    """Canonical root keys survive stripping unchanged."""
+@pytest.fixture(scope="module")
+def stripped_canonical() -> dict:
+    """Every canonical root key plus a few legacy fields, stripped once."""
     trade = {k: f"value_{k}" for k in _CANONICAL_ROOT_KEYS}
     # Also inject a few legacy fields to prove they're removed
     trade["spread_type"] = "put_credit_spread"
     trade["underlying"] = "SPY"
+    return strip_legacy_fields(trade)
 
-    result = strip_legacy_fields(trade)
 
-    for key in _CANONICAL_ROOT_KEYS:
-        assert key in result, f"Canonical key '{key}' was incorrectly stripped"
-        assert result[key] == f"value_{key}"
+@pytest.mark.parametrize("field", sorted(_LEGACY_FLAT_FIELDS))
+def test_strip_removes_all_legacy_keys(field: str, stripped_full: dict):
+    """Every key in _LEGACY_FLAT_FIELDS is removed from the output."""
+    assert field not in stripped_full, f"Legacy field '{field}' was not stripped"
+
+
+@pytest.mark.parametrize("key", sorted(_CANONICAL_ROOT_KEYS))
+def test_strip_preserves_canonical_root_keys(key: str, stripped_canonical: dict):
+    """Canonical root keys survive stripping unchanged."""
+    assert key in stripped_canonical, f"Canonical key '{key}' was incorrectly stripped"
+    assert stripped_canonical[key] == f"value_{key}"
 
 
 def test_strip_returns_new_dict():
@@ -165,44 +164,46 @@ def _make_raw_input() -> dict:
     }
 
 
-def test_normalize_then_strip_has_no_legacy_fields():
+@pytest.fixture(scope="module")
+def normalized_and_stripped() -> tuple[dict, dict]:
+    """Run normalize → strip once per module; the tests below only read."""
+    normalized = normalize_trade(_make_raw_input())
+    return normalized, strip_legacy_fields(normalized)
+
+
+@pytest.fixture(scope="module")
+def normalized_stripped(normalized_and_stripped: tuple[dict, dict]) -> dict:
+    return normalized_and_stripped[1]
+
+
+def test_normalize_then_strip_has_no_legacy_fields(normalized_stripped):
     """Full pipeline: normalize → strip must produce zero legacy keys."""
-    raw = _make_raw_input()
-    normalized = normalize_trade(raw)
-    clean = strip_legacy_fields(normalized)
+    clean = normalized_stripped
 
     found_legacy = {k for k in clean if k in _LEGACY_FLAT_FIELDS}
     assert not found_legacy, f"Legacy fields survived pipeline: {found_legacy}"
 
 
-def test_normalize_then_strip_preserves_computed():
+def test_normalize_then_strip_preserves_computed(normalized_stripped):
     """computed dict survives the pipeline with expected values."""
-    raw = _make_raw_input()
-    normalized = normalize_trade(raw)
-    clean = strip_legacy_fields(normalized)
+    clean = normalized_stripped
 
     comp = clean.get("computed", {})
-    assert comp.get("expected_value") == pytest.approx(25.0)
-    assert comp.get("max_profit") == pytest.approx(110.0)
-    assert comp.get("max_loss") == pytest.approx(390.0)
-    assert comp.get("pop") == pytest.approx(0.72)
+    expected = {"expected_value": 25.0, "max_profit": 110.0, "max_loss": 390.0, "pop": 0.72}
+    assert {k: comp.get(k) for k in expected} == pytest.approx(expected)
 
 
-def test_normalize_then_strip_preserves_identity():
+def test_normalize_then_strip_preserves_identity(normalized_stripped):
     """symbol and strategy_id survive the pipeline."""
-    raw = _make_raw_input()
-    normalized = normalize_trade(raw)
-    clean = strip_legacy_fields(normalized)
+    clean = normalized_stripped
 
     assert clean.get("symbol") == "SPY"
     assert clean.get("strategy_id") == "put_credit_spread"
 
 
-def test_normalize_then_strip_preserves_pills():
+def test_normalize_then_strip_preserves_pills(normalized_stripped):
     """pills sub-dict survives the pipeline."""
-    raw = _make_raw_input()
-    normalized = normalize_trade(raw)
-    clean = strip_legacy_fields(normalized)
+    clean = normalized_stripped
 
     pills = clean.get("pills")
     assert isinstance(pills, dict)
@@ -210,28 +211,24 @@ def test_normalize_then_strip_preserves_pills():
     assert "dte" in pills
 
 
-def test_normalize_then_strip_preserves_details():
+def test_normalize_then_strip_preserves_details(normalized_stripped):
     """details sub-dict survives the pipeline."""
-    raw = _make_raw_input()
-    normalized = normalize_trade(raw)
-    clean = strip_legacy_fields(normalized)
+    clean = normalized_stripped
 
     details = clean.get("details")
     assert isinstance(details, dict)
 
 
-def test_normalize_then_strip_preserves_trade_key():
+def test_normalize_then_strip_preserves_trade_key(normalized_stripped):
     """trade_key survives the pipeline."""
-    raw = _make_raw_input()
-    normalized = normalize_trade(raw)
-    clean = strip_legacy_fields(normalized)
+    clean = normalized_stripped
 
     assert clean.get("trade_key"), "trade_key must be present and non-empty"
 
 
 # ── 4. Existing normalize tests must still reference legacy back-fills ─
 
-def test_normalize_still_emits_some_legacy_fields_before_strip():
+def test_normalize_still_emits_some_legacy_fields_before_strip(normalized_and_stripped):
     """normalize_trade still passes through some legacy flat fields.
     
     Stripping happens at the API boundary, not inside normalize_trade().
@@ -239,8 +236,7 @@ def test_normalize_still_emits_some_legacy_fields_before_strip():
     raw input (e.g. spread_type, underlying) so strip_legacy_fields()
     has work to do.
     """
-    raw = _make_raw_input()
-    normalized = normalize_trade(raw)
+    normalized, _ = normalized_and_stripped
 
     # These passthrough fields still exist before stripping
     assert "spread_type" in normalized or "strategy" in normalized
@@ -1,4 +1,8 @@
+import pytest
+
 from app.utils.trade_key import (
+    _canonicalize_normalized_strategy,
+    _canonicalize_raw_trade_key,
     canonicalize_strategy_id,
     canonicalize_trade_key,
     is_canonical_trade_key,
@@ -13,13 +17,19 @@ def test_normalize_strike_stability():
     assert normalize_strike(None) == "NA"
 
 
-def test_trade_key_stability_and_defaults():
-    key_a = trade_key("spy", "2026-03-20", "credit_put_spread", 450.0, 445.50, 7)
-    key_b = trade_key("SPY", "2026-03-20", "credit_put_spread", "450", "445.5", "7")
+@pytest.mark.parametrize(
+    ("underlying", "short_strike", "long_strike", "dte"),
+    [
+        pytest.param("spy", 450.0, 445.50, 7, id="lower_float"),
+        pytest.param("SPY", "450", "445.5", "7", id="upper_str"),
+    ],
+)
+def test_trade_key_stability(underlying, short_strike, long_strike, dte):
+    key = trade_key(underlying, "2026-03-20", "credit_put_spread", short_strike, long_strike, dte)
+    assert key == "SPY|2026-03-20|put_credit_spread|450|445.5|7"
 
-    assert key_a == key_b
-    assert key_a == "SPY|2026-03-20|put_credit_spread|450|445.5|7"
 
+def test_trade_key_defaults():
     key_default = trade_key("QQQ", None, "single", None, None, None)
     assert key_default == "QQQ|NA|single|NA|NA|NA"
 
@@ -41,3 +51,17 @@ def test_is_canonical_trade_key_detects_alias_noncanonical() -> None:
     canonical = "SPY|2026-03-20|put_credit_spread|450|445|7"
     assert is_canonical_trade_key(legacy) is False
     assert is_canonical_trade_key(canonical) is True
+
+
+def test_canonicalizers_memoize_repeated_inputs() -> None:
+    _canonicalize_normalized_strategy.cache_clear()
+    _canonicalize_raw_trade_key.cache_clear()
+    for _ in range(3):
+        assert canonicalize_strategy_id(" Put_Credit ") == ("put_credit_spread", True, "put_credit")
+        assert canonicalize_trade_key("spy|2026-03-20|credit_put_spread|450.0|445.50|7") == (
+            "SPY|2026-03-20|put_credit_spread|450|445.5|7"
+        )
+    assert _canonicalize_normalized_strategy.cache_info().hits > 0
+    assert _canonicalize_raw_trade_key.cache_info().hits > 0
+    # Unhashable inputs still go through the public entry point.
+    assert canonicalize_strategy_id(["iron_condor"]) == (None, False, "['iron_condor']")
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import json
-
 from app.services.trade_lifecycle_service import TradeLifecycleService
 
 
@@ -34,15 +32,7 @@ def test_lifecycle_canonicalizes_alias_strategy_and_trade_key_and_emits_events(t
     events_path = tmp_path / "validation_events.jsonl"
     assert events_path.exists()
 
-    codes = []
-    with open(events_path, "r", encoding="utf-8") as handle:
-        for raw in handle:
-            text = raw.strip()
-            if not text:
-                continue
-            payload = json.loads(text)
-            if isinstance(payload, dict):
-                codes.append(str(payload.get("code") or ""))
+    codes = {event.get("code") for event in svc.validation_events.read_recent()}
 
     assert "TRADE_KEY_NON_CANONICAL" in codes
     assert "TRADE_STRATEGY_ALIAS_MAPPED" in codes
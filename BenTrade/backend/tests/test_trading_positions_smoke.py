@@ -1,17 +1,6 @@
-import sys
-import unittest
-from pathlib import Path
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, patch
 
-from fastapi.testclient import TestClient
-
-
-BACKEND_ROOT = Path(__file__).resolve().parents[1]
-if str(BACKEND_ROOT) not in sys.path:
-    sys.path.insert(0, str(BACKEND_ROOT))
-
-from app.main import create_app  # noqa: E402
+import pytest
 
 
 class _StubTradierClient:
@@ -42,43 +31,64 @@ async def _stub_request_json(client, method, url, **kwargs):
     return {}
 
 
-class TradingPositionsSmokeTests(unittest.TestCase):
-    def test_positions_returns_200_with_ok_false_when_credentials_missing(self):
-        app = create_app()
-        app.state.trading_service.settings = SimpleNamespace(
+@pytest.fixture(scope="module")
+def app():
+    """Build the FastAPI app once for the module."""
+    from app.main import create_app
+
+    return create_app()
+
+
+@pytest.fixture(scope="module")
+def client(app):
+    """One TestClient (and one startup/shutdown cycle) shared by the module."""
+    from fastapi.testclient import TestClient
+
+    with TestClient(app) as c:
+        yield c
+
+
+# Each test swaps only the mutable slice of app state via monkeypatch, which
+# restores the shared app's trading settings / tradier client at teardown.
+
+
+def test_positions_returns_200_with_ok_false_when_credentials_missing(app, client, monkeypatch):
+    monkeypatch.setattr(
+        app.state.trading_service,
+        "settings",
+        SimpleNamespace(
             TRADIER_TOKEN="",
             TRADIER_ACCOUNT_ID="",
             TRADIER_ENV="sandbox",
-        )
+        ),
+    )
 
-        with TestClient(app) as client:
-            response = client.get("/api/trading/positions")
+    response = client.get("/api/trading/positions")
 
-        self.assertEqual(response.status_code, 200)
-        payload = response.json()
-        self.assertEqual(payload.get("ok"), False)
-        self.assertEqual(payload.get("positions"), [])
-        self.assertIsInstance(payload.get("error"), dict)
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload.get("ok") is False
+    assert payload.get("positions") == []
+    assert isinstance(payload.get("error"), dict)
 
-    @patch("app.api.routes_active_trades.request_json", new=_stub_request_json)
-    def test_positions_returns_200_with_ok_true_when_credentials_present(self):
-        app = create_app()
-        app.state.trading_service.settings = SimpleNamespace(
+
+def test_positions_returns_200_with_ok_true_when_credentials_present(app, client, monkeypatch):
+    monkeypatch.setattr("app.api.routes_active_trades.request_json", _stub_request_json)
+    monkeypatch.setattr(
+        app.state.trading_service,
+        "settings",
+        SimpleNamespace(
             TRADIER_TOKEN="token",
             TRADIER_ACCOUNT_ID="account",
             TRADIER_ENV="sandbox",
-        )
-        app.state.tradier_client = _StubTradierClient()
-
-        with TestClient(app) as client:
-            response = client.get("/api/trading/positions")
-
-        self.assertEqual(response.status_code, 200)
-        payload = response.json()
-        self.assertEqual(payload.get("ok"), True)
-        self.assertIsInstance(payload.get("positions"), list)
-        self.assertIn(payload.get("account_mode"), ("live", None))
+        ),
+    )
+    monkeypatch.setattr(app.state, "tradier_client", _StubTradierClient())
 
+    response = client.get("/api/trading/positions")
 
-if __name__ == "__main__":
-    unittest.main()
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload.get("ok") is True
+    assert isinstance(payload.get("positions"), list)
+    assert payload.get("account_mode") in ("live", None)
@@ -1,6 +1,6 @@
-import unittest
 from datetime import datetime, timedelta, timezone
 
+import pytest
 from fastapi import HTTPException
 
 from app.config import Settings
@@ -38,8 +38,8 @@ class _FakeTradierClient:
 
 
 class _FakeBaseDataService:
-    def __init__(self):
-        self.tradier_client = _FakeTradierClient()
+    # Stateless, so every fake (including the missing-ask subclass) shares one.
+    tradier_client = _FakeTradierClient()
 
     def normalize_chain(self, contracts):
         out = []
@@ -57,7 +57,9 @@ class _FakeBaseDataService:
         return out
 
 
-def _make_service() -> TradingService:
+@pytest.fixture(scope="module")
+def trading_service() -> TradingService:
+    """One TradingService per module; ``_clear_repository`` resets its state."""
     settings = Settings(
         TRADING_CONFIRMATION_SECRET="test-secret",
         TRADIER_EXECUTION_ENABLED=False,
@@ -77,136 +79,138 @@ def _make_service() -> TradingService:
     )
 
 
+@pytest.fixture(autouse=True)
+def _clear_repository(trading_service: TradingService):
+    trading_service.repository.clear()
+    yield
+
+
 # Use a date guaranteed to be in the future for test fixtures
 _FUTURE_EXP = (datetime.now(timezone.utc) + timedelta(days=30)).strftime("%Y-%m-%d")
 
 
-class TradingWorkflowTests(unittest.IsolatedAsyncioTestCase):
-    async def test_preview_builds_multileg_ticket_and_checks(self):
-        service = _make_service()
-        req = TradingPreviewRequest(
-            symbol="SPY",
-            strategy="put_credit",
-            expiration=_FUTURE_EXP,
-            short_strike=665,
-            long_strike=660,
-            quantity=1,
-            limit_price=0.92,
-            mode="paper",
-        )
-
-        preview = await service.preview(req)
-
-        self.assertEqual(preview.ticket.strategy, "put_credit")
-        self.assertEqual(len(preview.ticket.legs), 2)
-        self.assertEqual({leg.side for leg in preview.ticket.legs}, {"SELL_TO_OPEN", "BUY_TO_OPEN"})
-        self.assertIn("width_ok", preview.checks)
-        self.assertTrue(preview.confirmation_token)
-
-    async def test_preview_hard_rejects_when_bid_ask_missing(self):
-        class _MissingAskBaseDataService(_FakeBaseDataService):
-            def normalize_chain(self, contracts):
-                rows = super().normalize_chain(contracts)
-                rows[1].ask = None
-                return rows
-
-        settings = Settings(
-            TRADING_CONFIRMATION_SECRET="test-secret",
-            TRADIER_EXECUTION_ENABLED=False,
-        )
-        service = TradingService(
-            settings=settings,
-            base_data_service=_MissingAskBaseDataService(),
-            repository=InMemoryTradingRepository(),
-            paper_broker=PaperBroker(),
-            live_broker=TradierBroker(settings=settings, http_client=None, dry_run=True),  # type: ignore[arg-type]
-        )
-
-        req = TradingPreviewRequest(
-            symbol="SPY",
-            strategy="put_credit",
-            expiration=_FUTURE_EXP,
-            short_strike=665,
-            long_strike=660,
-            quantity=1,
-            limit_price=0.92,
-            mode="paper",
-        )
-
-        with self.assertRaises(HTTPException):
-            await service.preview(req)
-
-    async def test_submit_is_idempotent_for_same_ticket_and_key(self):
-        service = _make_service()
-        req = TradingPreviewRequest(
-            symbol="SPY",
-            strategy="put_credit",
-            expiration=_FUTURE_EXP,
-            short_strike=665,
-            long_strike=660,
-            quantity=1,
-            limit_price=0.92,
-            mode="paper",
-        )
-        preview = await service.preview(req)
-
-        submit_req = TradingSubmitRequest(
-            ticket_id=preview.ticket.id,
-            confirmation_token=preview.confirmation_token,
-            idempotency_key="idem-abc-123",
-            mode="paper",
-        )
-
-        first = await service.submit(submit_req)
-        second = await service.submit(submit_req)
-
-        self.assertEqual(first.broker_order_id, second.broker_order_id)
-        self.assertEqual(first.status, second.status)
-
-    async def test_paper_broker_fill_simulation_credit(self):
-        broker = PaperBroker()
-        ticket = OrderTicket(
-            id="ticket-1",
-            mode="paper",
-            strategy="put_credit",
-            underlying="SPY",
-            expiration=_FUTURE_EXP,
-            quantity=1,
-            limit_price=0.75,
-            price_effect="CREDIT",
-            time_in_force="DAY",
-            legs=[
-                OrderLeg(
-                    option_type="put",
-                    expiration=_FUTURE_EXP,
-                    strike=665,
-                    side="SELL_TO_OPEN",
-                    quantity=1,
-                    bid=1.00,
-                    ask=1.10,
-                    mid=1.05,
-                ),
-                OrderLeg(
-                    option_type="put",
-                    expiration=_FUTURE_EXP,
-                    strike=660,
-                    side="BUY_TO_OPEN",
-                    quantity=1,
-                    bid=0.20,
-                    ask=0.30,
-                    mid=0.25,
-                ),
-            ],
-            estimated_max_profit=ProfitLossEstimate(per_spread=0.9, total=90),
-            estimated_max_loss=ProfitLossEstimate(per_spread=4.1, total=410),
-            created_at=datetime.now(timezone.utc),
-            asof_quote_ts=datetime.now(timezone.utc),
-            asof_chain_ts=datetime.now(timezone.utc),
-        )
-
-        result = await broker.place_order(ticket)
-        self.assertEqual(result.status, "FILLED")
-
-
-if __name__ == "__main__":
-    unittest.main()
+def test_preview_builds_multileg_ticket_and_checks(trading_service, run_async):
+    req = TradingPreviewRequest(
+        symbol="SPY",
+        strategy="put_credit",
+        expiration=_FUTURE_EXP,
+        short_strike=665,
+        long_strike=660,
+        quantity=1,
+        limit_price=0.92,
+        mode="paper",
+    )
+
+    preview = run_async(trading_service.preview(req))
+
+    assert preview.ticket.strategy == "put_credit"
+    assert len(preview.ticket.legs) == 2
+    assert {leg.side for leg in preview.ticket.legs} == {"SELL_TO_OPEN", "BUY_TO_OPEN"}
+    assert "width_ok" in preview.checks
+    assert preview.confirmation_token
+
+
+def test_preview_hard_rejects_when_bid_ask_missing(run_async):
+    class _MissingAskBaseDataService(_FakeBaseDataService):
+        def normalize_chain(self, contracts):
+            rows = super().normalize_chain(contracts)
+            rows[1].ask = None
+            return rows
+
+    settings = Settings(
+        TRADING_CONFIRMATION_SECRET="test-secret",
+        TRADIER_EXECUTION_ENABLED=False,
+    )
+    service = TradingService(
+        settings=settings,
+        base_data_service=_MissingAskBaseDataService(),
+        repository=InMemoryTradingRepository(),
+        paper_broker=PaperBroker(),
+        live_broker=TradierBroker(settings=settings, http_client=None, dry_run=True),  # type: ignore[arg-type]
+    )
+
+    req = TradingPreviewRequest(
+        symbol="SPY",
+        strategy="put_credit",
+        expiration=_FUTURE_EXP,
+        short_strike=665,
+        long_strike=660,
+        quantity=1,
+        limit_price=0.92,
+        mode="paper",
+    )
+
+    with pytest.raises(HTTPException):
+        run_async(service.preview(req))
+
+
+def test_submit_is_idempotent_for_same_ticket_and_key(trading_service, run_async):
+    req = TradingPreviewRequest(
+        symbol="SPY",
+        strategy="put_credit",
+        expiration=_FUTURE_EXP,
+        short_strike=665,
+        long_strike=660,
+        quantity=1,
+        limit_price=0.92,
+        mode="paper",
+    )
+    preview = run_async(trading_service.preview(req))
+
+    submit_req = TradingSubmitRequest(
+        ticket_id=preview.ticket.id,
+        confirmation_token=preview.confirmation_token,
+        idempotency_key="idem-abc-123",
+        mode="paper",
+    )
+
+    first = run_async(trading_service.submit(submit_req))
+    second = run_async(trading_service.submit(submit_req))
+
+    assert first.broker_order_id == second.broker_order_id
+    assert first.status == second.status
+
+
+def test_paper_broker_fill_simulation_credit(run_async):
+    broker = PaperBroker()
+    ticket = OrderTicket(
+        id="ticket-1",
+        mode="paper",
+        strategy="put_credit",
+        underlying="SPY",
+        expiration=_FUTURE_EXP,
+        quantity=1,
+        limit_price=0.75,
+        price_effect="CREDIT",
+        time_in_force="DAY",
+        legs=[
+            OrderLeg(
+                option_type="put",
+                expiration=_FUTURE_EXP,
+                strike=665,
+                side="SELL_TO_OPEN",
+                quantity=1,
+                bid=1.00,
+                ask=1.10,
+                mid=1.05,
+            ),
+            OrderLeg(
+                option_type="put",
+                expiration=_FUTURE_EXP,
+                strike=660,
+                side="BUY_TO_OPEN",
+                quantity=1,
+                bid=0.20,
+                ask=0.30,
+                mid=0.25,
+            ),
+        ],
+        estimated_max_profit=ProfitLossEstimate(per_spread=0.9, total=90),
+        estimated_max_loss=ProfitLossEstimate(per_spread=4.1, total=410),
+        created_at=datetime.now(timezone.utc),
+        asof_quote_ts=datetime.now(timezone.utc),
+        asof_chain_ts=datetime.now(timezone.utc),
+    )
+
+    result = run_async(broker.place_order(ticket))
+    assert result.status == "FILLED"
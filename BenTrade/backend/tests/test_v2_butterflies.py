@@ -23,9 +23,6 @@ Tests for:
 
 from __future__ import annotations
 
-import sys
-sys.path.insert(0, ".")
-
 import pytest
 
 from app.services.scanner_v2.contracts import (
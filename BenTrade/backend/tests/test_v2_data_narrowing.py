@@ -9,13 +9,10 @@ Covers:
 - Edge cases (empty chain, invalid data, etc.)
 """
 
-import sys
 from datetime import date
 
 import pytest
 
-sys.path.insert(0, ".")
-
 from app.services.scanner_v2.data.chain import (
     extract_options_list,
     normalize_chain,
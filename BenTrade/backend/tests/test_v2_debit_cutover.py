@@ -17,9 +17,6 @@ Tests that:
 
 from __future__ import annotations
 
-import sys
-sys.path.insert(0, ".")
-
 import pytest
 
 from app.services.scanner_v2.migration import (
@@ -12,18 +12,13 @@ Validates:
 
 from __future__ import annotations
 
-import sys
 from pathlib import Path
 from typing import Any
 
-BACKEND_ROOT = Path(__file__).resolve().parents[1]
-if str(BACKEND_ROOT) not in sys.path:
-    sys.path.insert(0, str(BACKEND_ROOT))
+from fastapi.testclient import TestClient
 
-from fastapi.testclient import TestClient  # noqa: E402
-
-from app.main import create_app  # noqa: E402
-from app.services import pipeline_run_store  # noqa: E402
+from app.main import create_app
+from app.services import pipeline_run_store
 
 
 # ---------------------------------------------------------------------------
@@ -7,9 +7,6 @@ verification hooks, and routing summary.
 
 from __future__ import annotations
 
-import sys
-sys.path.insert(0, ".")
-
 import pytest
 
 from app.services.scanner_v2.migration import (
@@ -10,9 +10,6 @@ Tests for:
 
 from __future__ import annotations
 
-import sys
-sys.path.insert(0, ".")
-
 import pytest
 from copy import deepcopy
 
@@ -9,9 +9,6 @@ Covers:
 """
 
 import pytest
-import sys
-
-sys.path.insert(0, ".")
 
 from app.services.scanner_v2.contracts import (
     V2Candidate,